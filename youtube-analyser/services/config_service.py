@@ -177,6 +177,27 @@ class ConfigService:
         self._config[section].update(updates)
         logger.debug(f"Updated config section: {section} with {len(updates)} values")
 
+    def reload(self):
+        """
+        Re-read default values and environment overrides.
+
+        The existing section dictionaries are refreshed in place, so references
+        handed out by the ``get_*_config`` accessors stay current.
+        """
+        defaults = self._load_default_config()
+
+        for section in list(self._config):
+            if section not in defaults:
+                del self._config[section]
+
+        for section, values in defaults.items():
+            current = self._config.setdefault(section, {})
+            current.clear()
+            current.update(values)
+
+        self._load_environment_overrides()
+        logger.debug("Reloaded configuration")
+
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration values."""
         return self._config.copy()
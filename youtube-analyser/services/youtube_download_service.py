@@ -1,12 +1,22 @@
 from typing import Optional, Dict, List
 import json
 import os
+import re
+import threading
+import time
 from pathlib import Path
 import yt_dlp
 from loguru import logger
 
 from services.minio_service import MinIOService
 
+# YouTube video IDs are 11 characters from the URL-safe base64 alphabet;
+# checking this up front avoids a network roundtrip for malformed IDs
+VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+
+# Fields returned by YouTubeDownloadService.get_video_summary
+VIDEO_SUMMARY_FIELDS = ("title", "duration", "uploader")
+
 
 class YouTubeDownloadService:
     """Service for downloading YouTube videos using yt-dlp with optional Minio storage."""
@@ -18,6 +28,8 @@ class YouTubeDownloadService:
         default_format: str = "bv*+ba/best",
         minio_folder: str = "downloads",
         cleanup_local: bool = True,
+        quiet: bool = False,
+        noprogress: bool = False,
     ):
         """
         Initialize the YouTube download service.
@@ -28,23 +40,65 @@ class YouTubeDownloadService:
             default_format: Default format selector (default: "bv*+ba/best")
             minio_folder: Folder in Minio bucket for videos (default: "downloads")
             cleanup_local: Whether to delete local files after Minio upload (default: True)
+            quiet: Suppress yt-dlp's own console output (default: False)
+            noprogress: Disable yt-dlp's built-in progress bar; the progress hook
+                still reports at most once per second (default: False)
         """
         self.minio_service = minio_service
         self.default_output_path = default_output_path
         self.default_format = default_format
         self.minio_folder = minio_folder
         self.cleanup_local = cleanup_local
+        self.quiet = quiet
+        self.noprogress = noprogress
+        # Per-thread YoutubeDL instances reused by metadata lookups; every one
+        # created is also tracked here so close() can release them all
+        self._local = threading.local()
+        self._ydl_instances: List[yt_dlp.YoutubeDL] = []
+        self._ydl_lock = threading.Lock()
 
     def _progress_hook(self, d: Dict) -> None:
         """Progress hook for displaying download progress."""
         if d.get("status") == "downloading":
+            # yt-dlp calls this for every chunk; refresh the line at most 1/s
+            now = time.monotonic()
+            if now - getattr(self._local, "last_progress", 0.0) < 1.0:
+                return
+            self._local.last_progress = now
+
             pct = (d.get("_percent_str") or "").strip()
             spd = (d.get("_speed_str") or "").strip()
             eta = (d.get("_eta_str") or "").strip()
             print(f"\r{pct:>6} {spd:>10} ETA {eta:>6}", end="", flush=True)
         elif d.get("status") == "finished":
+            # Let the next download on this thread print its first update
+            self._local.last_progress = 0.0
             print("\nMerging…", flush=True)
 
+    def _thread_ydl(self, name: str, ydl_opts: Dict) -> yt_dlp.YoutubeDL:
+        """
+        Return the YoutubeDL stored under ``name`` for this thread, creating it.
+
+        Reusing the instance across lookups on a thread avoids repeating
+        extractor setup per video; YoutubeDL is not thread-safe, so each thread
+        gets its own. Instances stay open until close() is called.
+        """
+        ydl = getattr(self._local, name, None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(ydl_opts)
+            setattr(self._local, name, ydl)
+            with self._ydl_lock:
+                self._ydl_instances.append(ydl)
+        return ydl
+
+    def close(self) -> None:
+        """Close every cached YoutubeDL instance created by metadata lookups."""
+        with self._ydl_lock:
+            instances, self._ydl_instances = self._ydl_instances, []
+            self._local = threading.local()
+        for ydl in instances:
+            ydl.close()
+
     def download_video(
         self,
         video_id: str,
@@ -75,6 +129,8 @@ class YouTubeDownloadService:
         """
         if not video_id or not isinstance(video_id, str):
             raise ValueError("Valid video ID is required")
+        if not VIDEO_ID_RE.fullmatch(video_id):
+            raise ValueError(f"Invalid YouTube video ID: {video_id}")
 
         output_path = output_path or self.default_output_path
         format_selector = format_selector or self.default_format
@@ -135,7 +191,8 @@ class YouTubeDownloadService:
             "fragment_retries": 5,
             "continuedl": True,
             "overwrites": False,
-            "quiet": False,
+            "quiet": self.quiet,
+            "noprogress": self.noprogress,
             "no_warnings": False,
             "concurrent_fragment_downloads": 5,
             # Anti-bot bypass options
@@ -237,20 +294,60 @@ class YouTubeDownloadService:
         """
         if not video_id:
             raise ValueError("Video ID cannot be empty")
+        if not VIDEO_ID_RE.fullmatch(video_id):
+            raise ValueError(f"Invalid YouTube video ID: {video_id}")
+
+        url = f"https://www.youtube.com/watch?v={video_id}"
+
+        try:
+            ydl = self._thread_ydl("info_ydl", {"quiet": True, "skip_download": True})
+            return ydl.extract_info(url, download=False)
+        except Exception as e:
+            logger.error(f"Failed to get video info for {video_id}: {str(e)}")
+            raise Exception(f"Failed to get video info for {video_id}: {str(e)}")
+
+    def get_video_summary(self, video_id: str) -> Dict:
+        """
+        Get a video's title, duration and uploader without downloading.
+
+        Cheaper than get_video_info: the extractor result is returned
+        unprocessed (no format selection) and the DASH/HLS manifests are not
+        fetched.
+
+        Args:
+            video_id: The YouTube video ID
+
+        Returns:
+            Dictionary with whichever of VIDEO_SUMMARY_FIELDS the extractor provided
+
+        Raises:
+            ValueError: If video ID is invalid
+            Exception: If fetching info fails
+        """
+        if not video_id:
+            raise ValueError("Video ID cannot be empty")
+        if not VIDEO_ID_RE.fullmatch(video_id):
+            raise ValueError(f"Invalid YouTube video ID: {video_id}")
 
         url = f"https://www.youtube.com/watch?v={video_id}"
 
         ydl_opts = {
             "quiet": True,
+            "skip_download": True,
+            "extract_flat": True,
+            "youtube_include_dash_manifest": False,
+            "youtube_include_hls_manifest": False,
         }
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return info
+            ydl = self._thread_ydl("summary_ydl", ydl_opts)
+            info = ydl.extract_info(url, download=False, process=False)
+            return {
+                field: info[field] for field in VIDEO_SUMMARY_FIELDS if field in info
+            }
         except Exception as e:
-            logger.error(f"Failed to get video info for {video_id}: {str(e)}")
-            raise Exception(f"Failed to get video info for {video_id}: {str(e)}")
+            logger.error(f"Failed to get video summary for {video_id}: {str(e)}")
+            raise Exception(f"Failed to get video summary for {video_id}: {str(e)}")
 
     def get_playlist_videos(self, playlist_url: str) -> List[Dict[str, str]]:
         """
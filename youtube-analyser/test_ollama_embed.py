@@ -5,21 +5,289 @@ Tests the mxbai-embed-large model using configuration from .env
 """
 
 import os
+import sys
 import asyncio
 import numpy as np
-import json
+import simsimd
+from numba import njit, prange
+import orjson
 import re
 import hashlib
-from typing import List, Dict, Any
+import functools
+import random
+import httpx
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 from loguru import logger
-from ollama import AsyncClient
+from ollama import AsyncClient, ResponseError
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 import time
 import uuid
 
+# Payload fields filtered on by _build_metadata_filter callers; indexing them
+# lets Qdrant resolve filters without scanning every payload.
+PAYLOAD_INDEX_FIELDS = (
+    ("word_count", models.PayloadSchemaType.INTEGER),
+    ("sentence_count", models.PayloadSchemaType.INTEGER),
+    ("avg_word_length", models.PayloadSchemaType.FLOAT),
+    ("tech_score", models.PayloadSchemaType.FLOAT),
+    ("embedding_norm", models.PayloadSchemaType.FLOAT),
+    ("has_numbers", models.PayloadSchemaType.BOOL),
+    ("has_urls", models.PayloadSchemaType.BOOL),
+    ("has_email", models.PayloadSchemaType.BOOL),
+    ("test_type", models.PayloadSchemaType.KEYWORD),
+    ("category", models.PayloadSchemaType.KEYWORD),
+    ("content_hash", models.PayloadSchemaType.KEYWORD),
+)
+
+# Keywords counted towards a text's tech_score. They are matched as
+# case-insensitive substrings, compiled into one alternation so the text is
+# scanned once rather than once per keyword. The alternation sits inside a
+# lookahead so matches can overlap (e.g. "ai" inside "data"), matching the
+# per-keyword substring test; no keyword is a prefix of another, so at most
+# one keyword can start at any position.
+TECH_KEYWORDS = (
+    "algorithm",
+    "machine learning",
+    "ai",
+    "neural",
+    "network",
+    "data",
+    "model",
+    "programming",
+    "code",
+    "software",
+    "computer",
+    "technology",
+    "digital",
+)
+TECH_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, TECH_KEYWORDS)) + "))", re.IGNORECASE
+)
+
+# Precompiled patterns for the per-text metadata features
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+DIGIT_RE = re.compile(r"\d")
+SPECIAL_CHAR_RE = re.compile(r"[^\w\s]")
+URL_RE = re.compile(r"https?://")
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+# Payload fields returned by search_similar_embeddings unless the caller asks
+# for a different set; Qdrant only sends these over the wire.
+SEARCH_RESULT_FIELDS = (
+    "text",
+    "model",
+    "batch_timestamp",
+    "word_count",
+    "tech_score",
+    "has_numbers",
+    "embedding_dimension",
+    "test_type",
+    "content_hash",
+)
+
+# Default number of texts sent to Ollama in a single /api/embed request
+EMBED_BATCH_SIZE = 64
+
+# Text embedded by the model probe and reused by the single embedding test
+SINGLE_EMBEDDING_TEST_TEXT = "This is a test sentence for embedding generation."
+
+# Row count above which row-wise cosine similarity uses the parallel JIT kernel
+JIT_COSINE_MIN_ROWS = 64
+
+# Supported Qdrant vector storage types and their NumPy equivalents
+STORAGE_DTYPES = {"float32": np.float32, "float16": np.float16}
+
+# Retry policy for /api/embed when Ollama is overloaded or rate limiting
+EMBED_RETRY_STATUS_CODES = frozenset({429, 503})
+EMBED_MAX_ATTEMPTS = 5
+EMBED_RETRY_INITIAL_DELAY = 0.2
+EMBED_RETRY_MAX_DELAY = 5.0
+
+# Text pairs with varying similarity levels for test_similarity_analysis
+TEST_PAIRS = (
+    # High similarity - synonymous phrases
+    ("The cat sat on the mat", "A feline rested on the carpet"),
+    ("Machine learning algorithms", "Artificial intelligence models"),
+    ("Deep neural networks", "Multi-layer perceptron architectures"),
+    # Medium similarity - related concepts
+    ("Python programming language", "JavaScript programming language"),
+    ("Cloud computing infrastructure", "Distributed system architecture"),
+    ("Data science methodology", "Statistical analysis techniques"),
+    # Low similarity - different domains
+    ("The weather is sunny today", "I love eating pizza"),
+    ("Quantum physics principles", "Medieval history events"),
+    ("Basketball game strategy", "Cooking recipe instructions"),
+    # Technical vs. Non-technical
+    ("Neural network backpropagation", "Walking in the park peacefully"),
+    ("Database query optimization", "Sunset over the ocean waves"),
+)
+
+# Texts with different characteristics for test_metadata_storage_and_search
+TEST_TEXTS_WITH_METADATA = (
+    {
+        "text": "Machine learning algorithms process data efficiently using neural networks and deep learning techniques.",
+        "expected_metadata": {"test_type": "tech_content", "category": "AI"},
+    },
+    {
+        "text": "The weather is sunny today! Temperature is 25°C. Perfect for a walk in the park.",
+        "expected_metadata": {
+            "test_type": "casual_content",
+            "category": "weather",
+        },
+    },
+    {
+        "text": "Email me at test@example.com or visit https://example.com for more information about our services.",
+        "expected_metadata": {
+            "test_type": "contact_content",
+            "category": "business",
+        },
+    },
+    {
+        "text": "Short text",
+        "expected_metadata": {
+            "test_type": "short_content",
+            "category": "minimal",
+        },
+    },
+    {
+        "text": "This is a very long text with many words that should result in higher word count statistics. "
+        * 10,
+        "expected_metadata": {
+            "test_type": "long_content",
+            "category": "verbose",
+        },
+    },
+)
+
+
+def compute_embedding_stats_batch(embeddings: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute summary statistics for every row of a 2-D embedding matrix.
+
+    Mean, std and norm are derived from a single sum and sum of squares per row
+    so the whole batch is reduced in a few vectorized passes.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    dimension = vectors.shape[1]
+    totals = vectors.sum(axis=1, dtype=np.float64)
+    sum_squares = np.einsum("ij,ij->i", vectors, vectors).astype(np.float64)
+    means = totals / dimension
+    return {
+        "dimension": np.full(len(vectors), dimension),
+        "mean": means,
+        "std": np.sqrt(np.maximum(sum_squares / dimension - means * means, 0.0)),
+        "min": vectors.min(axis=1).astype(np.float64),
+        "max": vectors.max(axis=1).astype(np.float64),
+        "norm": np.sqrt(sum_squares),
+        "non_zero_count": np.count_nonzero(vectors, axis=1),
+    }
+
+
+def compute_embedding_stats(embedding: List[float]) -> Dict[str, Any]:
+    """Compute summary statistics for a single embedding vector."""
+    stats = compute_embedding_stats_batch(np.asarray([embedding], dtype=np.float32))
+    return {key: values[0].item() for key, values in stats.items()}
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def rowwise_cosine_jit(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity of two float32 matrices, one thread per row block."""
+    similarities = np.empty(left.shape[0], dtype=np.float32)
+    for i in prange(left.shape[0]):
+        dot = np.float32(0.0)
+        norm_left = np.float32(0.0)
+        norm_right = np.float32(0.0)
+        for j in range(left.shape[1]):
+            dot += left[i, j] * right[i, j]
+            norm_left += left[i, j] * left[i, j]
+            norm_right += right[i, j] * right[i, j]
+        denominator = np.sqrt(norm_left) * np.sqrt(norm_right)
+        similarities[i] = dot / denominator if denominator > 0 else np.float32(0.0)
+    return similarities
+
+
+def rowwise_cosine_similarity(
+    left: List[List[float]], right: List[List[float]], normalized: bool = False
+) -> np.ndarray:
+    """Cosine similarity between each row of ``left`` and the same row of ``right``.
+
+    Rows already scaled to unit length can pass ``normalized=True`` to skip the
+    row norms. Batches larger than JIT_COSINE_MIN_ROWS use the parallel Numba
+    kernel; smaller ones are not worth the thread fan-out.
+    """
+    a = np.asarray(left, dtype=np.float32)
+    b = np.asarray(right, dtype=np.float32)
+    if normalized:
+        return np.einsum("ij,ij->i", a, b)
+    if len(a) > JIT_COSINE_MIN_ROWS:
+        return rowwise_cosine_jit(np.ascontiguousarray(a), np.ascontiguousarray(b))
+    # Given two equally shaped matrices, SimSIMD computes row-wise distances
+    return 1.0 - np.asarray(simsimd.cosine(a, b))
+
+
+@functools.lru_cache(maxsize=4096)
+def compute_text_metadata(text: str) -> Dict[str, Any]:
+    """Generate comprehensive metadata for a text.
+
+    Results are cached per text; callers must copy before mutating.
+    """
+    # Basic text statistics
+    word_count = len(text.split())
+    sentence_count = len([s for s in SENTENCE_SPLIT_RE.split(text) if s.strip()])
+    char_count = len(text)
+    char_count_no_spaces = len(text.replace(" ", ""))
+
+    # Text complexity metrics
+    avg_word_length = (
+        np.mean([len(word) for word in text.split()]) if word_count > 0 else 0
+    )
+    avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
+
+    # Language patterns
+    has_numbers = bool(DIGIT_RE.search(text))
+    has_special_chars = bool(SPECIAL_CHAR_RE.search(text))
+    has_urls = bool(URL_RE.search(text))
+    has_email = bool(EMAIL_RE.search(text))
+
+    # Technical content detection - one regex pass over the text
+    matched_keywords = {m.group(1).lower() for m in TECH_KEYWORD_RE.finditer(text)}
+    tech_score = len(matched_keywords) / len(TECH_KEYWORDS)
+
+    # Content hash for deduplication
+    content_hash = hashlib.md5(text.encode()).hexdigest()
+
+    return {
+        # Text statistics
+        "word_count": word_count,
+        "sentence_count": sentence_count,
+        "char_count": char_count,
+        "char_count_no_spaces": char_count_no_spaces,
+        "avg_word_length": float(avg_word_length),
+        "avg_sentence_length": float(avg_sentence_length),
+        # Content patterns
+        "has_numbers": has_numbers,
+        "has_special_chars": has_special_chars,
+        "has_urls": has_urls,
+        "has_email": has_email,
+        "tech_score": float(tech_score),
+        # Identification
+        "content_hash": content_hash,
+        "text_preview": text[:100],
+        "text_suffix": text[-50:] if len(text) > 50 else text,
+    }
+
+
+def l2_normalize(embedding: List[float], dtype: type = np.float32) -> List[float]:
+    """Scale an embedding to unit length so dot product equals cosine similarity.
+
+    The result is rounded to ``dtype`` so it matches the collection's storage type.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return (vector / norm if norm else vector).astype(dtype).tolist()
+
 
 class OllamaEmbeddingTester:
     """Test class for Ollama embedding functionality."""
@@ -36,17 +304,76 @@ class OllamaEmbeddingTester:
         # Get Qdrant configuration - MANDATORY
         self.qdrant_url = os.getenv("QDRANT_URL", "http://nvda:30333")
         self.collection_name = os.getenv("QDRANT_COLLECTION", "ollama_embeddings_test")
+        # Vector storage precision in Qdrant: "float16" halves vector RAM and
+        # bytes on the wire, "float32" keeps full precision
+        self.storage_dtype = os.getenv("QDRANT_STORAGE_DTYPE", "float16")
+        if self.storage_dtype not in STORAGE_DTYPES:
+            raise ValueError(
+                f"Unsupported QDRANT_STORAGE_DTYPE '{self.storage_dtype}', "
+                f"expected one of {sorted(STORAGE_DTYPES)}"
+            )
+        # Texts per /api/embed request; read here so values from .env apply
+        batch_size = os.getenv("OLLAMA_EMBED_BATCH_SIZE", str(EMBED_BATCH_SIZE))
+        if not batch_size.strip().isdigit() or int(batch_size) < 1:
+            raise ValueError(
+                f"Unsupported OLLAMA_EMBED_BATCH_SIZE '{batch_size}', "
+                "expected an integer >= 1"
+            )
+        self.embed_batch_size = int(batch_size)
 
         # Set up log file
         if log_file is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             suffix = "_with_embeddings" if include_embeddings else "_stats_only"
-            self.log_file = f"embedding_test_results_{timestamp}{suffix}.json"
+            self.log_file = f"embedding_test_results_{timestamp}{suffix}.jsonl"
         else:
             self.log_file = log_file
 
-        # Initialize async client
-        self.client = AsyncClient(host=self.ollama_url)
+        # Embedding vectors are appended to a float32 sidecar instead of the JSON
+        # log; log entries only reference their row index in this file.
+        self.embeddings_file = f"{self.log_file}.f32"
+        self._emb_fh = open(self.embeddings_file, "wb") if include_embeddings else None
+        self._emb_count = 0
+
+        # Cached collection info, refreshed when stale or after an upsert
+        self._collection_info_cache = None
+        self._collection_info_ts = 0.0
+
+        # Initialize async client on a pooled keep-alive transport so concurrent
+        # embed calls reuse connections (HTTP/2 is negotiated for https hosts)
+        self._ollama_transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(
+                max_connections=64, max_keepalive_connections=32, keepalive_expiry=60
+            ),
+        )
+        self.client = AsyncClient(
+            host=self.ollama_url, transport=self._ollama_transport, timeout=60
+        )
+        # /api/embed is called directly on the same pool so request and
+        # response bodies go through orjson instead of the stdlib json module
+        self._http = httpx.AsyncClient(
+            base_url=self.ollama_url,
+            transport=self._ollama_transport,
+            timeout=60,
+            headers={"Content-Type": "application/json"},
+        )
+
+        # Bounds the number of embed requests in flight at once
+        self._sem = asyncio.Semaphore(int(os.getenv("OLLAMA_CONCURRENCY", "8")))
+
+        # Successful embedding results keyed by _embedding_cache_key(text)
+        self._emb_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Vector dimension and tokenizer fingerprint, filled in by _probe_model
+        self._model_probe: Optional[Dict[str, Any]] = None
+        self._tokenizer_hash = ""
+
+        # Optional embed endpoint that returns raw little-endian float32 rows
+        # instead of JSON; only used once _probe_model has verified it
+        self.binary_endpoint = os.getenv("OLLAMA_BINARY_ENDPOINT")
+        self._use_binary_endpoint = False
 
         # Initialize Qdrant client - MANDATORY
         try:
@@ -71,18 +398,21 @@ class OllamaEmbeddingTester:
             )
             raise SystemExit(f"Qdrant initialization failed: {str(e)}")
 
-        # Initialize test results log
-        self.test_results = {
-            "test_session": {
-                "timestamp": datetime.now().isoformat(),
-                "model_name": self.model_name,
-                "ollama_url": self.ollama_url,
-                "qdrant_url": self.qdrant_url,
-                "collection_name": self.collection_name,
-                "log_file": self.log_file,
-            },
-            "tests": [],
+        # Test results are streamed to a JSON-lines log: a session header
+        # record followed by one record per logged test result
+        self.test_session = {
+            "timestamp": datetime.now().isoformat(),
+            "model_name": self.model_name,
+            "ollama_url": self.ollama_url,
+            "qdrant_url": self.qdrant_url,
+            "collection_name": self.collection_name,
+            "log_file": self.log_file,
+            "embeddings_file": self.embeddings_file if include_embeddings else None,
         }
+        self._log_fp = open(self.log_file, "ab")
+        self._write_log_record({"test_session": self.test_session})
+        self._logged_count = 0
+        self._stored_embedding_count = 0
 
         logger.info(
             f"Initialized Ollama embedding tester with {self.ollama_url} using model {self.model_name}"
@@ -92,36 +422,59 @@ class OllamaEmbeddingTester:
             f"✅ Qdrant storage ready: {self.qdrant_url} collection: {self.collection_name}"
         )
 
+    async def __aenter__(self) -> "OllamaEmbeddingTester":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Release the pooled Ollama connections, the Qdrant client and open files."""
+        await self._http.aclose()  # also closes the shared transport
+        self.qdrant_client.close()
+        self._log_fp.close()
+        if self._emb_fh is not None:
+            self._emb_fh.close()
+
     def log_test_result(self, test_type: str, test_data: Dict[str, Any]) -> None:
-        """Log test result to the results structure."""
-        test_entry = {
-            "test_type": test_type,
-            "timestamp": datetime.now().isoformat(),
-            "data": test_data,
-        }
-        self.test_results["tests"].append(test_entry)
+        """Append a test result record to the JSON-lines log."""
+        self._write_log_record(
+            {
+                "test_type": test_type,
+                "timestamp": datetime.now().isoformat(),
+                "data": test_data,
+            }
+        )
+        self._logged_count += 1
         logger.info(f"Logged {test_type} test result")
 
+    def _write_log_record(self, record: Dict[str, Any]) -> None:
+        """Serialize one record as a line of the JSON-lines log."""
+        self._log_fp.write(
+            orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+        )
+
+    def write_embedding_vector(self, embedding: List[float]) -> int:
+        """Append an embedding to the float32 sidecar and return its row index."""
+        np.asarray(embedding, dtype=np.float32).tofile(self._emb_fh)
+        index = self._emb_count
+        self._emb_count += 1
+        return index
+
     def save_results_to_file(self) -> None:
-        """Save all test results to JSON file."""
+        """Flush the streamed test results and embedding sidecar to disk."""
         try:
-            with open(self.log_file, "w", encoding="utf-8") as f:
-                json.dump(self.test_results, f, indent=2, ensure_ascii=False)
+            self._log_fp.flush()
 
             # Get file size for logging
             file_size = os.path.getsize(self.log_file)
             size_mb = file_size / (1024 * 1024)
+            logger.success(
+                f"{self._logged_count} test results saved to {self.log_file} ({size_mb:.1f} MB)"
+            )
 
-            if self.include_embeddings and size_mb > 10:
-                logger.warning(
-                    f"Large log file created: {self.log_file} ({size_mb:.1f} MB)"
-                )
-                logger.info(
-                    "Note: mxbai-embed-large produces 1024-dimension vectors (~4KB each as JSON)"
-                )
-            else:
+            if self._emb_fh is not None:
+                self._emb_fh.flush()
+                emb_size_mb = os.path.getsize(self.embeddings_file) / (1024 * 1024)
                 logger.success(
-                    f"Test results saved to {self.log_file} ({size_mb:.1f} MB)"
+                    f"{self._emb_count} embedding vectors saved to {self.embeddings_file} ({emb_size_mb:.1f} MB)"
                 )
 
         except Exception as e:
@@ -150,11 +503,14 @@ class OllamaEmbeddingTester:
             )
 
             if not collection_exists:
-                # Create collection with proper vector configuration
+                # Vectors are L2-normalized before upsert and query, so DOT
+                # gives cosine similarity without per-comparison norms
                 self.qdrant_client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config=models.VectorParams(
-                        size=vector_dimension, distance=models.Distance.COSINE
+                        size=vector_dimension,
+                        distance=models.Distance.DOT,
+                        datatype=models.Datatype(self.storage_dtype),
                     ),
                 )
                 logger.success(
@@ -165,8 +521,17 @@ class OllamaEmbeddingTester:
                     f"📦 Qdrant collection already exists: {self.collection_name}"
                 )
 
+            # Index filterable payload fields (idempotent for existing collections)
+            for field_name, field_schema in PAYLOAD_INDEX_FIELDS:
+                self.qdrant_client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                )
+            logger.info(f"🗂️ Ensured {len(PAYLOAD_INDEX_FIELDS)} payload indexes")
+
             # Verify collection is accessible by getting info
-            collection_info = self.qdrant_client.get_collection(self.collection_name)
+            collection_info = self._get_collection_info(max_age=0.0)
             vector_count = collection_info.points_count or 0
             vector_size = collection_info.config.params.vectors.size
             logger.info(
@@ -178,141 +543,133 @@ class OllamaEmbeddingTester:
             logger.error(f"❌ FATAL: Failed to setup Qdrant collection: {str(e)}")
             raise SystemExit(f"Qdrant collection setup failed: {str(e)}")
 
+    def _get_collection_info(self, max_age: float = 5.0) -> models.CollectionInfo:
+        """Get collection info, reusing the cached copy if it is younger than max_age."""
+        now = time.monotonic()
+        if (
+            self._collection_info_cache is None
+            or now - self._collection_info_ts > max_age
+        ):
+            self._collection_info_cache = self.qdrant_client.get_collection(
+                self.collection_name
+            )
+            self._collection_info_ts = now
+        return self._collection_info_cache
+
     def generate_text_metadata(self, text: str) -> Dict[str, Any]:
         """Generate comprehensive metadata for a text."""
-        # Basic text statistics
-        word_count = len(text.split())
-        sentence_count = len([s for s in re.split(r"[.!?]+", text) if s.strip()])
-        char_count = len(text)
-        char_count_no_spaces = len(text.replace(" ", ""))
-
-        # Text complexity metrics
-        avg_word_length = (
-            np.mean([len(word) for word in text.split()]) if word_count > 0 else 0
-        )
-        avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
-
-        # Language patterns
-        has_numbers = bool(re.search(r"\d", text))
-        has_special_chars = bool(re.search(r"[^\w\s]", text))
-        has_urls = bool(re.search(r"https?://", text))
-        has_email = bool(
-            re.search(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", text)
-        )
-
-        # Technical content detection
-        tech_keywords = [
-            "algorithm",
-            "machine learning",
-            "ai",
-            "neural",
-            "network",
-            "data",
-            "model",
-            "programming",
-            "code",
-            "software",
-            "computer",
-            "technology",
-            "digital",
-        ]
-        tech_score = sum(
-            1 for keyword in tech_keywords if keyword.lower() in text.lower()
-        ) / len(tech_keywords)
-
-        # Content hash for deduplication
-        content_hash = hashlib.md5(text.encode()).hexdigest()
-
-        return {
-            # Text statistics
-            "word_count": word_count,
-            "sentence_count": sentence_count,
-            "char_count": char_count,
-            "char_count_no_spaces": char_count_no_spaces,
-            "avg_word_length": float(avg_word_length),
-            "avg_sentence_length": float(avg_sentence_length),
-            # Content patterns
-            "has_numbers": has_numbers,
-            "has_special_chars": has_special_chars,
-            "has_urls": has_urls,
-            "has_email": has_email,
-            "tech_score": float(tech_score),
-            # Identification
-            "content_hash": content_hash,
-            "text_preview": text[:100],
-            "text_suffix": text[-50:] if len(text) > 50 else text,
-        }
+        return dict(compute_text_metadata(text))
 
     def store_embedding_in_qdrant(
         self, text: str, embedding: List[float], metadata: Dict[str, Any] = None
     ) -> str:
         """Store embedding in Qdrant with comprehensive metadata and return the point ID."""
+        return self.store_embeddings_batch([(text, embedding, metadata)])[0]
+
+    def store_embeddings_batch(
+        self, items: List[Tuple[str, List[float], Optional[Dict[str, Any]]]]
+    ) -> List[str]:
+        """Store (text, embedding, metadata) items in Qdrant and return their point IDs.
+
+        The timestamp and batch ID are computed once and shared by every point in
+        the batch instead of being rebuilt per point, and embedding statistics and
+        normalization are computed for the whole batch at once.
+        """
 
         try:
-            # Generate unique ID for this embedding
-            point_id = str(uuid.uuid4())
-
-            # Generate comprehensive text metadata
-            text_metadata = self.generate_text_metadata(text)
-
-            # Calculate embedding statistics
-            embedding_array = np.array(embedding)
-            embedding_metadata = {
-                "embedding_dimension": len(embedding),
-                "embedding_mean": float(np.mean(embedding_array)),
-                "embedding_std": float(np.std(embedding_array)),
-                "embedding_min": float(np.min(embedding_array)),
-                "embedding_max": float(np.max(embedding_array)),
-                "embedding_norm": float(np.linalg.norm(embedding_array)),
-                "embedding_non_zero_count": int(np.count_nonzero(embedding_array)),
-                "embedding_hash": hashlib.md5(str(embedding).encode()).hexdigest()[:16],
-            }
+            start_time = time.perf_counter()
+            batch_id = str(uuid.uuid4())
+            batch_timestamp = datetime.now().isoformat()
 
-            # Prepare comprehensive payload
-            payload = {
-                # Core data
-                "text": text,
-                "model": self.model_name,
-                "timestamp": datetime.now().isoformat(),
-                "point_id": point_id,
-                # Text metadata
-                **text_metadata,
-                # Embedding metadata
-                **embedding_metadata,
-                # Custom metadata from caller
-                **(metadata or {}),
-            }
+            # Draw the random bytes for every point ID with a single urandom call
+            random_bytes = os.urandom(16 * len(items))
 
-            # Prepare point data
-            point = models.PointStruct(
-                id=point_id,
-                vector=embedding,
-                payload=payload,
+            matrix = np.stack([np.asarray(item[1], dtype=np.float32) for item in items])
+            embedding_stats = {
+                key: values.tolist()
+                for key, values in compute_embedding_stats_batch(matrix).items()
+            }
+            norms = np.asarray(embedding_stats["norm"], dtype=np.float32)
+            vectors = (
+                (matrix / np.where(norms > 0, norms, 1.0)[:, None])
+                .astype(STORAGE_DTYPES[self.storage_dtype])
+                .tolist()
             )
 
+            points = []
+            for i, (text, _, metadata) in enumerate(items):
+                # Generate unique ID for this embedding
+                point_id = str(
+                    uuid.UUID(bytes=random_bytes[i * 16 : (i + 1) * 16], version=4)
+                )
+
+                # Generate comprehensive text metadata
+                text_metadata = self.generate_text_metadata(text)
+
+                embedding_metadata = {
+                    f"embedding_{key}": values[i]
+                    for key, values in embedding_stats.items()
+                }
+                embedding_metadata["embedding_hash"] = hashlib.md5(
+                    matrix[i].tobytes()
+                ).hexdigest()[:16]
+
+                # Prepare comprehensive payload
+                payload = {
+                    # Core data
+                    "text": text,
+                    "model": self.model_name,
+                    "batch_id": batch_id,
+                    "batch_timestamp": batch_timestamp,
+                    "point_id": point_id,
+                    # Text metadata
+                    **text_metadata,
+                    # Embedding metadata
+                    **embedding_metadata,
+                    # Custom metadata from caller
+                    **(metadata or {}),
+                }
+
+                points.append(
+                    models.PointStruct(
+                        id=point_id,
+                        vector=vectors[i],
+                        payload=payload,
+                    )
+                )
+
             # Store in Qdrant
             operation_result = self.qdrant_client.upsert(
-                collection_name=self.collection_name, points=[point]
+                collection_name=self.collection_name, points=points
             )
+            self._collection_info_cache = None
 
-            # Log detailed operation result status
-            logger.info("📊 Qdrant upsert operation result:")
-            logger.info(
+            # Per-point details go to DEBUG; INFO only gets the batch summary
+            logger.debug("📊 Qdrant upsert operation result:")
+            logger.debug(
                 f"   🔹 Status: {operation_result.status if hasattr(operation_result, 'status') else 'Unknown'}"
             )
-            logger.info(
+            logger.debug(
                 f"   🔹 Operation ID: {operation_result.operation_id if hasattr(operation_result, 'operation_id') else 'N/A'}"
             )
 
             if operation_result:
-                logger.success("💾 Successfully stored embedding in Qdrant:")
-                logger.info(f"   🔹 Point ID: {point_id}")
-                logger.info(
-                    f"   🔹 Text preview: '{text[:50]}{'...' if len(text) > 50 else ''}'"
+                for point in points:
+                    text = point.payload["text"]
+                    logger.debug(f"   🔹 Point ID: {point.id}")
+                    logger.debug(
+                        f"   🔹 Text preview: '{text[:50]}{'...' if len(text) > 50 else ''}'"
+                    )
+                    logger.debug(f"   🔹 Vector dimension: {len(point.vector)}")
+
+                elapsed = time.perf_counter() - start_time
+                rate = len(points) / elapsed if elapsed else float("inf")
+                logger.success(
+                    f"💾 Stored {len(points)} embedding(s) in Qdrant collection "
+                    f"'{self.collection_name}' in {elapsed:.2f}s "
+                    f"({rate:.0f} vec/s, batch {batch_id})"
                 )
-                logger.info(f"   🔹 Vector dimension: {len(embedding)}")
-                logger.info(f"   🔹 Collection: {self.collection_name}")
-                return point_id
+                return [point.id for point in points]
             else:
                 logger.error(
                     "❌ FATAL: Qdrant upsert operation failed - operation_result is falsy"
@@ -327,12 +684,17 @@ class OllamaEmbeddingTester:
         query_embedding: List[float],
         limit: int = 5,
         metadata_filter: Dict[str, Any] = None,
+        fields: Sequence[str] = SEARCH_RESULT_FIELDS,
     ) -> List[Dict]:
-        """Search for similar embeddings in Qdrant with optional metadata filtering."""
+        """Search for similar embeddings in Qdrant with optional metadata filtering.
+
+        Only the payload ``fields`` are fetched; each result holds ``point_id``,
+        ``score`` and those fields as returned by Qdrant.
+        """
 
         try:
             # First verify the collection exists and has points
-            collection_info = self.qdrant_client.get_collection(self.collection_name)
+            collection_info = self._get_collection_info()
             points_count = collection_info.points_count or 0
 
             if points_count == 0:
@@ -353,28 +715,17 @@ class OllamaEmbeddingTester:
 
             search_result = self.qdrant_client.query_points(
                 collection_name=self.collection_name,
-                query=query_embedding,
+                query=l2_normalize(query_embedding),
                 limit=limit,
                 query_filter=query_filter,
+                with_payload=list(fields),
+                with_vectors=False,
             )
 
-            similar_embeddings = []
-            for point in search_result.points:
-                result_data = {
-                    "point_id": point.id,
-                    "score": point.score,
-                    "text": point.payload.get("text", ""),
-                    "model": point.payload.get("model", ""),
-                    "timestamp": point.payload.get("timestamp", ""),
-                    # Enhanced metadata
-                    "word_count": point.payload.get("word_count", 0),
-                    "tech_score": point.payload.get("tech_score", 0),
-                    "has_numbers": point.payload.get("has_numbers", False),
-                    "embedding_dimension": point.payload.get("embedding_dimension", 0),
-                    "test_type": point.payload.get("test_type", "unknown"),
-                    "content_hash": point.payload.get("content_hash", ""),
-                }
-                similar_embeddings.append(result_data)
+            similar_embeddings = [
+                {"point_id": point.id, "score": point.score, **point.payload}
+                for point in search_result.points
+            ]
 
             logger.success("🔍 Qdrant similarity search completed:")
             logger.info(f"   🔹 Query vector dimension: {len(query_embedding)}")
@@ -437,123 +788,155 @@ class OllamaEmbeddingTester:
         self, metadata_filter: Dict[str, Any], limit: int = 10
     ) -> List[Dict]:
         """Search for embeddings based purely on metadata criteria without vector similarity."""
+        return self.search_by_metadata_batch([metadata_filter], limit=limit)[0]
+
+    def search_by_metadata_batch(
+        self, metadata_filters: Sequence[Dict[str, Any]], limit: int = 10
+    ) -> List[List[Dict]]:
+        """Run several metadata-only searches in a single Qdrant round-trip.
+
+        Returns one result list per filter, in the order the filters were given.
+        """
         try:
-            collection_info = self.qdrant_client.get_collection(self.collection_name)
+            collection_info = self._get_collection_info()
             points_count = collection_info.points_count or 0
 
             if points_count == 0:
                 logger.error(f"❌ Collection '{self.collection_name}' is empty")
-                return []
+                return [[] for _ in metadata_filters]
 
             logger.info(
                 f"🔍 Metadata-only search in collection '{self.collection_name}' with {points_count} points"
             )
-            logger.info(f"🔍 Filter criteria: {metadata_filter}")
-
-            query_filter = self._build_metadata_filter(metadata_filter)
+            for metadata_filter in metadata_filters:
+                logger.info(f"🔍 Filter criteria: {metadata_filter}")
 
-            # Use scroll to get points matching metadata criteria
-            scroll_result = self.qdrant_client.scroll(
+            # Filter-only queries (no vector) return matching points like scroll
+            responses = self.qdrant_client.query_batch_points(
                 collection_name=self.collection_name,
-                scroll_filter=query_filter,
-                limit=limit,
-                with_payload=True,
-                with_vectors=False,  # We don't need vectors for metadata search
+                requests=[
+                    models.QueryRequest(
+                        filter=self._build_metadata_filter(metadata_filter),
+                        limit=limit,
+                        with_payload=True,
+                        with_vector=False,  # We don't need vectors for metadata search
+                    )
+                    for metadata_filter in metadata_filters
+                ],
             )
 
-            results = []
-            for point in scroll_result[0]:  # scroll returns (points, next_page_offset)
-                result_data = {
-                    "point_id": point.id,
-                    "text": point.payload.get("text", ""),
-                    "model": point.payload.get("model", ""),
-                    "timestamp": point.payload.get("timestamp", ""),
-                    "word_count": point.payload.get("word_count", 0),
-                    "sentence_count": point.payload.get("sentence_count", 0),
-                    "tech_score": point.payload.get("tech_score", 0),
-                    "has_numbers": point.payload.get("has_numbers", False),
-                    "has_urls": point.payload.get("has_urls", False),
-                    "embedding_dimension": point.payload.get("embedding_dimension", 0),
-                    "test_type": point.payload.get("test_type", "unknown"),
-                    "content_hash": point.payload.get("content_hash", ""),
-                }
-                results.append(result_data)
+            batch_results = [
+                [
+                    {
+                        "point_id": point.id,
+                        "text": point.payload.get("text", ""),
+                        "model": point.payload.get("model", ""),
+                        "timestamp": point.payload.get("batch_timestamp", ""),
+                        "word_count": point.payload.get("word_count", 0),
+                        "sentence_count": point.payload.get("sentence_count", 0),
+                        "tech_score": point.payload.get("tech_score", 0),
+                        "has_numbers": point.payload.get("has_numbers", False),
+                        "has_urls": point.payload.get("has_urls", False),
+                        "embedding_dimension": point.payload.get(
+                            "embedding_dimension", 0
+                        ),
+                        "test_type": point.payload.get("test_type", "unknown"),
+                        "content_hash": point.payload.get("content_hash", ""),
+                    }
+                    for point in response.points
+                ]
+                for response in responses
+            ]
 
             logger.success(
-                f"🔍 Metadata search completed: {len(results)} results found"
+                f"🔍 Metadata search completed: {sum(map(len, batch_results))} results "
+                f"found across {len(batch_results)} filters"
             )
-            return results
+            return batch_results
 
         except Exception as e:
             logger.error(f"❌ Failed to search by metadata: {str(e)}")
-            return []
+            return [[] for _ in metadata_filters]
 
     def get_collection_metadata_stats(self) -> Dict[str, Any]:
         """Get statistics about metadata in the collection."""
         try:
-            collection_info = self.qdrant_client.get_collection(self.collection_name)
+            collection_info = self._get_collection_info()
             points_count = collection_info.points_count or 0
 
             if points_count == 0:
                 return {"error": "Collection is empty"}
 
-            # Get a sample of points to analyze metadata
-            scroll_result = self.qdrant_client.scroll(
+            # Boolean flags are counted server-side - no points are transferred
+            has_numbers_count = self.qdrant_client.count(
                 collection_name=self.collection_name,
-                limit=min(100, points_count),  # Sample up to 100 points
-                with_payload=True,
-                with_vectors=False,
-            )
-
-            points = scroll_result[0]
+                count_filter=self._build_metadata_filter({"has_numbers": True}),
+                exact=True,
+            ).count
+            has_urls_count = self.qdrant_client.count(
+                collection_name=self.collection_name,
+                count_filter=self._build_metadata_filter({"has_urls": True}),
+                exact=True,
+            ).count
+
+            # Scroll the whole collection, fetching only the fields we aggregate
+            payloads = []
+            offset = None
+            while True:
+                points, offset = self.qdrant_client.scroll(
+                    collection_name=self.collection_name,
+                    limit=256,
+                    offset=offset,
+                    with_payload=["word_count", "tech_score", "test_type"],
+                    with_vectors=False,
+                )
+                payloads.extend(p.payload for p in points)
+                if offset is None:
+                    break
 
             # Analyze metadata statistics
-            word_counts = [
-                p.payload.get("word_count", 0)
-                for p in points
-                if p.payload.get("word_count")
-            ]
-            tech_scores = [
-                p.payload.get("tech_score", 0)
-                for p in points
-                if p.payload.get("tech_score")
-            ]
-            test_types = [p.payload.get("test_type", "unknown") for p in points]
-            has_numbers_count = sum(
-                1 for p in points if p.payload.get("has_numbers", False)
+            word_counts = np.fromiter(
+                (p.get("word_count") or 0 for p in payloads),
+                dtype=np.float64,
+                count=len(payloads),
+            )
+            word_counts = word_counts[word_counts > 0]
+            tech_scores = np.fromiter(
+                (p.get("tech_score") or 0 for p in payloads),
+                dtype=np.float64,
+                count=len(payloads),
+            )
+            tech_scores = tech_scores[tech_scores > 0]
+            test_types, test_type_counts = np.unique(
+                [p.get("test_type", "unknown") for p in payloads], return_counts=True
             )
-            has_urls_count = sum(1 for p in points if p.payload.get("has_urls", False))
 
             stats = {
                 "total_points": points_count,
-                "sample_size": len(points),
+                "sample_size": len(payloads),
                 "word_count_stats": {
-                    "min": min(word_counts) if word_counts else 0,
-                    "max": max(word_counts) if word_counts else 0,
-                    "mean": np.mean(word_counts) if word_counts else 0,
-                    "std": np.std(word_counts) if word_counts else 0,
+                    "min": float(word_counts.min()) if word_counts.size else 0,
+                    "max": float(word_counts.max()) if word_counts.size else 0,
+                    "mean": float(word_counts.mean()) if word_counts.size else 0,
+                    "std": float(word_counts.std()) if word_counts.size else 0,
                 },
                 "tech_score_stats": {
-                    "min": min(tech_scores) if tech_scores else 0,
-                    "max": max(tech_scores) if tech_scores else 0,
-                    "mean": np.mean(tech_scores) if tech_scores else 0,
+                    "min": float(tech_scores.min()) if tech_scores.size else 0,
+                    "max": float(tech_scores.max()) if tech_scores.size else 0,
+                    "mean": float(tech_scores.mean()) if tech_scores.size else 0,
                 },
                 "content_flags": {
-                    "has_numbers_percentage": (
-                        (has_numbers_count / len(points) * 100) if points else 0
-                    ),
-                    "has_urls_percentage": (
-                        (has_urls_count / len(points) * 100) if points else 0
-                    ),
+                    "has_numbers_percentage": has_numbers_count / points_count * 100,
+                    "has_urls_percentage": has_urls_count / points_count * 100,
                 },
                 "test_type_distribution": {
-                    test_type: test_types.count(test_type)
-                    for test_type in set(test_types)
+                    str(test_type): int(count)
+                    for test_type, count in zip(test_types, test_type_counts)
                 },
             }
 
             logger.success(
-                f"📊 Collection metadata statistics computed from {len(points)} points"
+                f"📊 Collection metadata statistics computed from {len(payloads)} points"
             )
             return stats
 
@@ -605,7 +988,7 @@ class OllamaEmbeddingTester:
                         f"   {i}. [{similarity_percentage:.1f}%] '{result['text'][:60]}{'...' if len(result['text']) > 60 else ''}'"
                     )
                     logger.info(
-                        f"      ID: {result['point_id']}, Length: {result['text_length']} chars"
+                        f"      ID: {result['point_id']}, Length: {len(result['text'])} chars"
                     )
             else:
                 logger.warning(f"⚠️ No similar embeddings found for: '{query_text}'")
@@ -645,130 +1028,337 @@ class OllamaEmbeddingTester:
             f"🎯 Similarity search summary: {successful_searches}/{len(search_queries)} queries successful, {total_results} total results found"
         )
 
-    async def test_single_embedding(self, text: str) -> Dict[str, Any]:
-        """Test embedding generation for a single text."""
+    async def _post_embed_request(self, url: str, texts: List[str]) -> httpx.Response:
+        """POST an embed request, returning the final response.
+
+        429/503 responses are retried after the server's Retry-After delay, or
+        with exponential backoff and jitter when it sends none, up to
+        EMBED_MAX_ATTEMPTS; either delay is capped at EMBED_RETRY_MAX_DELAY, and
+        the semaphore is released while backing off.
+        """
+        body = orjson.dumps({"model": self.model_name, "input": texts})
+        for attempt in range(EMBED_MAX_ATTEMPTS):
+            async with self._sem:
+                response = await self._http.post(url, content=body)
+            if (
+                response.status_code not in EMBED_RETRY_STATUS_CODES
+                or attempt == EMBED_MAX_ATTEMPTS - 1
+            ):
+                break
+            retry_after = response.headers.get("Retry-After", "")
+            delay = min(
+                EMBED_RETRY_MAX_DELAY,
+                (
+                    float(retry_after)
+                    if retry_after.isdigit()
+                    else EMBED_RETRY_INITIAL_DELAY * 2**attempt
+                    + random.uniform(0, EMBED_RETRY_INITIAL_DELAY)
+                ),
+            )
+            logger.warning(
+                f"Ollama returned {response.status_code}, retrying in {delay:.2f}s "
+                f"(attempt {attempt + 1}/{EMBED_MAX_ATTEMPTS})"
+            )
+            await asyncio.sleep(delay)
+
+        if response.is_error:
+            raise ResponseError(response.text, response.status_code)
+        return response
+
+    async def _embed_chunk(self, texts: List[str]) -> np.ndarray:
+        """Embed one sub-batch of texts with a single embed request.
+
+        The vectors are packed into one contiguous float32 matrix so callers
+        never hold lists of boxed Python floats. When the binary endpoint is
+        enabled the response body is that matrix and is used without parsing.
+        """
+        if self._use_binary_endpoint:
+            response = await self._post_embed_request(self.binary_endpoint, texts)
+            embeddings = np.frombuffer(response.content, dtype="<f4")
+            if not texts or embeddings.size % len(texts):
+                raise ValueError("No embeddings in response")
+            return embeddings.reshape(len(texts), -1)
+
+        response = await self._post_embed_request("/api/embed", texts)
+        embeddings = orjson.loads(response.content).get("embeddings") or []
+        if len(embeddings) != len(texts):
+            raise ValueError("No embeddings in response")
+        return np.asarray(embeddings, dtype=np.float32)
+
+    async def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed texts with one /api/embed request per sub-batch.
+
+        Ollama runs a single forward pass per request, so texts are sent in
+        sub-batches of OLLAMA_EMBED_BATCH_SIZE instead of one request per text. The
+        sub-batches are issued concurrently, bounded by OLLAMA_CONCURRENCY.
+
+        Texts are grouped by length so each sub-batch pads to a similar
+        sequence length; rows are returned in the original input order.
+        """
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        sorted_texts = [texts[i] for i in order]
+        chunks = await asyncio.gather(
+            *(
+                self._embed_chunk(sorted_texts[i : i + self.embed_batch_size])
+                for i in range(0, len(sorted_texts), self.embed_batch_size)
+            )
+        )
+        return np.concatenate(chunks)[np.argsort(order)]
+
+    def _embedding_cache_key(self, text: str) -> str:
+        """Fingerprint a text for the embedding cache (model, tokenizer and content)."""
+        return hashlib.blake2b(
+            f"{self.model_name}\0{self._tokenizer_hash}\0{text}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    async def _fetch_tokenizer_hash(self) -> str:
+        """Hash the tokenizer metadata and model details reported by /api/show."""
         try:
-            logger.info(f"Generating embedding for text: '{text[:50]}...'")
-            start_time = time.time()
+            response = await self.client.show(self.model_name)
+        except ResponseError as e:
+            logger.warning(f"Could not fetch model details for {self.model_name}: {e}")
+            return ""
+        tokenizer_info = {
+            key: value
+            for key, value in (response.modelinfo or {}).items()
+            if key.startswith("tokenizer.")
+        }
+        details = response.details.model_dump() if response.details else None
+        return hashlib.blake2b(
+            orjson.dumps(
+                {"tokenizer": tokenizer_info, "details": details},
+                option=orjson.OPT_SORT_KEYS,
+                default=str,
+            ),
+            digest_size=8,
+        ).hexdigest()
+
+    async def _probe_model(self) -> Dict[str, Any]:
+        """Check the model once, caching its vector dimension and tokenizer hash.
+
+        The probe embeds SINGLE_EMBEDDING_TEST_TEXT, so the single embedding test
+        is then served from the embedding cache instead of a second request.
+        """
+        if self._model_probe is not None:
+            return self._model_probe
+
+        self._tokenizer_hash = await self._fetch_tokenizer_hash()
+        result = await self.test_single_embedding(SINGLE_EMBEDDING_TEST_TEXT)
+        if not result["success"]:
+            return result
+
+        # Compile (or load from cache) the JIT cosine kernel before it is timed
+        dimension = result["stats"]["dimension"]
+        warmup = np.ones((1, dimension), dtype=np.float32)
+        rowwise_cosine_jit(warmup, warmup)
+
+        if self.binary_endpoint:
+            self._use_binary_endpoint = await self._probe_binary_endpoint(
+                result["embedding"]
+            )
 
-            response = await self.client.embed(model=self.model_name, input=text)
+        self._model_probe = {
+            "success": True,
+            "vector_dimension": dimension,
+            "tokenizer_hash": self._tokenizer_hash,
+            "binary_endpoint": self._use_binary_endpoint,
+        }
+        return self._model_probe
 
-            end_time = time.time()
+    async def _probe_binary_endpoint(self, expected: np.ndarray) -> bool:
+        """Check that OLLAMA_BINARY_ENDPOINT returns the probe embedding as float32."""
+        try:
+            response = await self._post_embed_request(
+                self.binary_endpoint, [SINGLE_EMBEDDING_TEST_TEXT]
+            )
+        except (httpx.HTTPError, ResponseError) as e:
+            logger.warning(f"Binary embed endpoint unavailable, using JSON: {e}")
+            return False
 
-            if "embeddings" in response and len(response["embeddings"]) > 0:
-                embedding = response["embeddings"][0]
-                embedding_length = len(embedding)
-
-                logger.success("Embedding generated successfully")
-                logger.info(f"   Vector dimension: {embedding_length}")
-                logger.info(f"   Generation time: {end_time - start_time:.2f}s")
-
-                # Calculate basic statistics
-                embedding_array = np.array(embedding)
-                stats = {
-                    "dimension": embedding_length,
-                    "mean": float(np.mean(embedding_array)),
-                    "std": float(np.std(embedding_array)),
-                    "min": float(np.min(embedding_array)),
-                    "max": float(np.max(embedding_array)),
-                    "norm": float(np.linalg.norm(embedding_array)),
-                    "generation_time": end_time - start_time,
-                }
+        if len(response.content) != expected.nbytes:
+            logger.warning(
+                f"Binary embed endpoint returned {len(response.content)} bytes, "
+                f"expected {expected.nbytes}; using JSON"
+            )
+            return False
+        vector = np.frombuffer(response.content, dtype="<f4")
+        if self.calculate_similarity(vector, expected) < 0.999:
+            logger.warning(
+                "Binary embed endpoint disagrees with /api/embed; using JSON"
+            )
+            return False
 
-                # Store in Qdrant - MANDATORY
-                # Setup collection on first embedding (we now know the dimension)
-                if not hasattr(self, "_qdrant_setup_done"):
-                    self.setup_qdrant_collection(embedding_length)
-                    self._qdrant_setup_done = True
-
-                # Store embedding with metadata
-                qdrant_point_id = self.store_embedding_in_qdrant(
-                    text,
-                    embedding,
-                    {"test_type": "single_embedding"},
-                )
+        logger.success(f"✅ Using binary embed endpoint {self.binary_endpoint}")
+        return True
 
-                result = {
-                    "success": True,
-                    "embedding": embedding,
-                    "stats": stats,
-                    "text_length": len(text),
-                    "text_preview": text[:100],  # Store first 100 chars for reference
-                    "qdrant_point_id": qdrant_point_id,
-                }
+    async def _generate_embeddings(
+        self, texts: List[str], force_store: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Return one result dict per text, serving repeated texts from the cache.
 
-                # Log the test result with optional full embedding
-                log_data = {
-                    "input_text": text,
-                    "success": True,
-                    "embedding_dimension": stats["dimension"],
-                    "generation_time": stats["generation_time"],
-                    "embedding_stats": stats,
-                    "text_length": len(text),
-                    "qdrant_point_id": qdrant_point_id,
-                }
+        Cache hits skip both the Ollama request and the Qdrant store unless
+        ``force_store`` is set; misses are embedded together and cached.
+        """
+        results = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            cached = (
+                None
+                if force_store
+                else self._emb_cache.get(self._embedding_cache_key(text))
+            )
+            if cached is not None:
+                logger.info(f"Reusing cached embedding for text: '{text[:50]}...'")
+                results[i] = {**cached, "cached": True}
+            else:
+                pending.append(i)
 
-                if self.include_embeddings:
-                    log_data["embedding_vector"] = (
-                        embedding  # Store the actual embedding vector
-                    )
+        if pending:
+            new_results = await self._embed_and_store([texts[i] for i in pending])
+            for i, result in zip(pending, new_results):
+                results[i] = result
+                if result["success"]:
+                    self._emb_cache[self._embedding_cache_key(texts[i])] = result
 
-                self.log_test_result("single_embedding", log_data)
+        return results
 
-                return result
-            else:
-                logger.error("No embeddings returned in response")
-                error_result = {"success": False, "error": "No embeddings in response"}
+    async def _embed_and_store(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Embed texts in one batched call, store them in Qdrant and log each one.
+
+        Returns one result dict per text, in input order, shaped like the
+        result of test_single_embedding.
+        """
+        try:
+            start_time = time.time()
+            embeddings = await self._embed_batch(texts)
+            end_time = time.time()
+        except Exception as e:
+            logger.error(f"Failed to generate embedding: {str(e)}")
 
-                # Log the failed test
+            # Log the failed tests
+            for text in texts:
                 self.log_test_result(
                     "single_embedding",
                     {
                         "input_text": text,
                         "success": False,
-                        "error": "No embeddings in response",
+                        "error": str(e),
                         "text_length": len(text),
                     },
                 )
 
-                return error_result
+            return [{"success": False, "error": str(e)} for _ in texts]
 
-        except Exception as e:
-            logger.error(f"Failed to generate embedding: {str(e)}")
-            error_result = {"success": False, "error": str(e)}
+        # The request is shared, so each text is attributed an equal slice of it
+        generation_time = (end_time - start_time) / len(texts)
+        embedding_length = embeddings.shape[1]
 
-            # Log the failed test
-            self.log_test_result(
-                "single_embedding",
-                {
-                    "input_text": text,
-                    "success": False,
-                    "error": str(e),
-                    "text_length": len(text),
-                },
+        logger.success(f"Generated {len(embeddings)} embedding(s) successfully")
+        logger.info(f"   Vector dimension: {embedding_length}")
+        logger.info(f"   Generation time: {end_time - start_time:.2f}s")
+
+        # Store in Qdrant - MANDATORY
+        # Setup collection on first embedding (we now know the dimension)
+        if not hasattr(self, "_qdrant_setup_done"):
+            self.setup_qdrant_collection(embedding_length)
+            self._qdrant_setup_done = True
+
+        # Store all embeddings with metadata in a single upsert
+        qdrant_point_ids = self.store_embeddings_batch(
+            [
+                (text, embedding, {"test_type": "single_embedding"})
+                for text, embedding in zip(texts, embeddings)
+            ]
+        )
+
+        self._stored_embedding_count += len(qdrant_point_ids)
+
+        batch_stats = {
+            key: values.tolist()
+            for key, values in compute_embedding_stats_batch(embeddings).items()
+        }
+
+        results = [None] * len(texts)
+        for i, (text, embedding, qdrant_point_id) in enumerate(
+            zip(texts, embeddings, qdrant_point_ids)
+        ):
+            # Calculate basic statistics
+            stats = {key: values[i] for key, values in batch_stats.items()}
+            stats["generation_time"] = generation_time
+
+            embedding_index = (
+                self.write_embedding_vector(embedding)
+                if self.include_embeddings
+                else None
             )
 
-            return error_result
+            results[i] = {
+                "success": True,
+                "embedding": embedding,
+                "embedding_index": embedding_index,
+                "stats": stats,
+                "text_length": len(text),
+                "text_preview": text[:100],  # Store first 100 chars for reference
+                "qdrant_point_id": qdrant_point_id,
+            }
+
+            # Log the test result with optional full embedding
+            log_data = {
+                "input_text": text,
+                "success": True,
+                "embedding_dimension": stats["dimension"],
+                "generation_time": stats["generation_time"],
+                "embedding_stats": stats,
+                "text_length": len(text),
+                "qdrant_point_id": qdrant_point_id,
+            }
+
+            if self.include_embeddings:
+                # Row of the embedding vector in the float32 sidecar file
+                log_data["embedding_index"] = embedding_index
+
+            self.log_test_result("single_embedding", log_data)
+
+        return results
+
+    async def test_single_embedding(
+        self, text: str, force_store: bool = False
+    ) -> Dict[str, Any]:
+        """Test embedding generation for a single text."""
+        logger.info(f"Generating embedding for text: '{text[:50]}...'")
+        return (await self._generate_embeddings([text], force_store=force_store))[0]
+
+    def _batch_result_entry(self, text: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the per-text log entry recorded for a batch embedding test."""
+        success = result["success"]
+        entry = {
+            "input_text": text,
+            "text_preview": text[:50] + "..." if len(text) > 50 else text,
+            "success": success,
+            "generation_time": result["stats"]["generation_time"] if success else 0,
+            "embedding_stats": result.get("stats") if success else None,
+            "qdrant_point_id": result.get("qdrant_point_id") if success else None,
+            "error": None if success else result.get("error"),
+        }
+        if self.include_embeddings and success:
+            entry["embedding_index"] = result.get("embedding_index")
+        return entry
 
     async def test_batch_embeddings(self, texts: List[str]) -> Dict[str, Any]:
         """Test embedding generation for multiple texts."""
         logger.info(f"Generating embeddings for {len(texts)} texts")
 
-        results = []
         total_start = time.time()
-
-        for i, text in enumerate(texts):
-            logger.info(f"Processing text {i + 1}/{len(texts)}")
-            result = await self.test_single_embedding(text)
-            results.append(result)
-
-            # Small delay to avoid overwhelming the server
-            await asyncio.sleep(0.1)
-
+        results = await self._generate_embeddings(texts)
         total_time = time.time() - total_start
 
         # Calculate batch statistics
         successful_results = [r for r in results if r["success"]]
+        individual_results = [
+            self._batch_result_entry(text, result)
+            for text, result in zip(texts, results)
+        ]
 
         if successful_results:
             dimensions = [r["stats"]["dimension"] for r in successful_results]
@@ -793,32 +1383,7 @@ class OllamaEmbeddingTester:
                 f"   Throughput: {batch_stats['throughput_per_second']:.2f} embeddings/sec"
             )
 
-            # Log batch results with optional full embeddings
-            individual_results = []
-            for text, result in zip(texts, results):
-                result_data = {
-                    "input_text": text,
-                    "text_preview": text[:50] + "..." if len(text) > 50 else text,
-                    "success": result["success"],
-                    "generation_time": (
-                        result.get("stats", {}).get("generation_time", 0)
-                        if result["success"]
-                        else 0
-                    ),
-                    "embedding_stats": (
-                        result.get("stats") if result["success"] else None
-                    ),
-                    "qdrant_point_id": (
-                        result.get("qdrant_point_id") if result["success"] else None
-                    ),
-                    "error": result.get("error") if not result["success"] else None,
-                }
-
-                if self.include_embeddings and result["success"]:
-                    result_data["embedding_vector"] = result.get("embedding")
-
-                individual_results.append(result_data)
-
+            # Log batch results with optional embedding indices
             self.log_test_result(
                 "batch_embeddings",
                 {
@@ -831,26 +1396,6 @@ class OllamaEmbeddingTester:
             return {"success": True, "results": results, "batch_stats": batch_stats}
         else:
             # Log failed batch results
-            individual_results = []
-            for text, result in zip(texts, results):
-                result_data = {
-                    "input_text": text,
-                    "text_preview": text[:50] + "..." if len(text) > 50 else text,
-                    "success": result["success"],
-                    "embedding_stats": (
-                        result.get("stats") if result["success"] else None
-                    ),
-                    "qdrant_point_id": (
-                        result.get("qdrant_point_id") if result["success"] else None
-                    ),
-                    "error": result.get("error") if not result["success"] else None,
-                }
-
-                if self.include_embeddings and result["success"]:
-                    result_data["embedding_vector"] = result.get("embedding")
-
-                individual_results.append(result_data)
-
             self.log_test_result(
                 "batch_embeddings",
                 {
@@ -868,48 +1413,66 @@ class OllamaEmbeddingTester:
             }
 
     def calculate_similarity(
-        self, embedding1: List[float], embedding2: List[float]
+        self,
+        embedding1: List[float],
+        embedding2: List[float],
+        normalized: bool = False,
     ) -> float:
-        """Calculate cosine similarity between two embeddings."""
-        vec1 = np.array(embedding1)
-        vec2 = np.array(embedding2)
+        """Calculate cosine similarity between two embeddings.
+
+        Pass ``normalized=True`` for unit-length inputs (e.g. vectors read back
+        from the DOT collection) to skip the norm computation entirely.
+        """
+        vec1 = np.asarray(embedding1, dtype=np.float32)
+        vec2 = np.asarray(embedding2, dtype=np.float32)
 
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        if normalized:
+            return float(np.dot(vec1, vec2))
 
-        return dot_product / (norm1 * norm2)
+        # SimSIMD's cosine kernel returns the cosine distance
+        return float(1.0 - simsimd.cosine(vec1, vec2))
 
     async def test_similarity_analysis(self) -> None:
         """Test semantic similarity between different texts."""
         logger.info("Testing semantic similarity analysis")
 
-        # Test texts with varying similarity levels
-        test_pairs = [
-            # High similarity - synonymous phrases
-            ("The cat sat on the mat", "A feline rested on the carpet"),
-            ("Machine learning algorithms", "Artificial intelligence models"),
-            ("Deep neural networks", "Multi-layer perceptron architectures"),
-            # Medium similarity - related concepts
-            ("Python programming language", "JavaScript programming language"),
-            ("Cloud computing infrastructure", "Distributed system architecture"),
-            ("Data science methodology", "Statistical analysis techniques"),
-            # Low similarity - different domains
-            ("The weather is sunny today", "I love eating pizza"),
-            ("Quantum physics principles", "Medieval history events"),
-            ("Basketball game strategy", "Cooking recipe instructions"),
-            # Technical vs. Non-technical
-            ("Neural network backpropagation", "Walking in the park peacefully"),
-            ("Database query optimization", "Sunset over the ocean waves"),
-        ]
-
         similarity_results = []
 
-        for text1, text2 in test_pairs:
-            logger.info(f"Comparing: '{text1}' vs '{text2}'")
+        # Embed every pair concurrently; the semaphore bounds in-flight requests
+        pair_embeddings = await asyncio.gather(
+            *(
+                asyncio.gather(
+                    self.test_single_embedding(text1),
+                    self.test_single_embedding(text2),
+                )
+                for text1, text2 in TEST_PAIRS
+            )
+        )
 
-            result1 = await self.test_single_embedding(text1)
-            result2 = await self.test_single_embedding(text2)
+        # Score all successful pairs with one vectorized row-wise cosine
+        comparable = [
+            i
+            for i, (result1, result2) in enumerate(pair_embeddings)
+            if result1["success"] and result2["success"]
+        ]
+        similarities = (
+            dict(
+                zip(
+                    comparable,
+                    rowwise_cosine_similarity(
+                        [pair_embeddings[i][0]["embedding"] for i in comparable],
+                        [pair_embeddings[i][1]["embedding"] for i in comparable],
+                    ),
+                )
+            )
+            if comparable
+            else {}
+        )
+
+        for i, ((text1, text2), (result1, result2)) in enumerate(
+            zip(TEST_PAIRS, pair_embeddings)
+        ):
+            logger.info(f"Comparing: '{text1}' vs '{text2}'")
 
             pair_result = {
                 "text1": text1,
@@ -919,9 +1482,7 @@ class OllamaEmbeddingTester:
             }
 
             if result1["success"] and result2["success"]:
-                similarity = self.calculate_similarity(
-                    result1["embedding"], result2["embedding"]
-                )
+                similarity = similarities[i]
                 logger.info(f"   Cosine similarity: {similarity:.4f}")
 
                 similarity_data = {
@@ -936,8 +1497,8 @@ class OllamaEmbeddingTester:
                 if self.include_embeddings:
                     similarity_data.update(
                         {
-                            "embedding1_vector": result1["embedding"],
-                            "embedding2_vector": result2["embedding"],
+                            "embedding1_index": result1["embedding_index"],
+                            "embedding2_index": result2["embedding_index"],
                         }
                     )
 
@@ -967,7 +1528,7 @@ class OllamaEmbeddingTester:
             "similarity_analysis",
             {
                 "test_pairs": similarity_results,
-                "total_pairs": len(test_pairs),
+                "total_pairs": len(TEST_PAIRS),
                 "successful_comparisons": len(
                     [r for r in similarity_results if r["similarity_computed"]]
                 ),
@@ -991,14 +1552,16 @@ class OllamaEmbeddingTester:
             # Try to get model information if available
             logger.info(f"Checking model information for {self.model_name}")
 
-            # Test with a simple text to verify model is accessible
-            test_result = await self.test_single_embedding("Test embedding")
+            # Embed a simple text to verify the model is accessible
+            test_result = await self._probe_model()
 
             if test_result["success"]:
                 model_info = {
                     "model_name": self.model_name,
                     "ollama_url": self.ollama_url,
-                    "vector_dimension": test_result["stats"]["dimension"],
+                    "vector_dimension": test_result["vector_dimension"],
+                    "tokenizer_hash": test_result["tokenizer_hash"],
+                    "binary_endpoint": test_result["binary_endpoint"],
                     "model_accessible": True,
                 }
 
@@ -1034,79 +1597,49 @@ class OllamaEmbeddingTester:
         """Test comprehensive metadata storage and search functionality."""
         logger.info("🔍 Testing metadata storage and search functionality")
 
-        # Test texts with different characteristics for metadata analysis
-        test_texts_with_metadata = [
-            {
-                "text": "Machine learning algorithms process data efficiently using neural networks and deep learning techniques.",
-                "expected_metadata": {"test_type": "tech_content", "category": "AI"},
-            },
-            {
-                "text": "The weather is sunny today! Temperature is 25°C. Perfect for a walk in the park.",
-                "expected_metadata": {
-                    "test_type": "casual_content",
-                    "category": "weather",
-                },
-            },
-            {
-                "text": "Email me at test@example.com or visit https://example.com for more information about our services.",
-                "expected_metadata": {
-                    "test_type": "contact_content",
-                    "category": "business",
-                },
-            },
-            {
-                "text": "Short text",
-                "expected_metadata": {
-                    "test_type": "short_content",
-                    "category": "minimal",
-                },
-            },
-            {
-                "text": "This is a very long text with many words that should result in higher word count statistics. "
-                * 10,
-                "expected_metadata": {
-                    "test_type": "long_content",
-                    "category": "verbose",
-                },
-            },
-        ]
-
         stored_points = []
 
         # Store embeddings with custom metadata
         logger.info(
-            f"📊 Storing {len(test_texts_with_metadata)} test embeddings with metadata"
+            f"📊 Storing {len(TEST_TEXTS_WITH_METADATA)} test embeddings with metadata"
+        )
+        results = await asyncio.gather(
+            *(
+                self.test_single_embedding(item["text"])
+                for item in TEST_TEXTS_WITH_METADATA
+            )
         )
-        for i, item in enumerate(test_texts_with_metadata):
-            text = item["text"]
-            custom_metadata = item["expected_metadata"]
-
-            logger.info(f"Processing text {i + 1}: '{text[:50]}...'")
-            result = await self.test_single_embedding(text)
 
+        # Store additional metadata beyond what's automatically generated,
+        # upserting every successful embedding in one batch
+        for i, (item, result) in enumerate(zip(TEST_TEXTS_WITH_METADATA, results)):
             if result["success"]:
-                # Store additional metadata beyond what's automatically generated
-                enhanced_metadata = {**custom_metadata, "test_sequence": i}
-                point_id = self.store_embedding_in_qdrant(
-                    text, result["embedding"], enhanced_metadata
-                )
                 stored_points.append(
                     {
-                        "point_id": point_id,
-                        "text": text,
-                        "metadata": enhanced_metadata,
+                        "text": item["text"],
+                        "metadata": {**item["expected_metadata"], "test_sequence": i},
                         "embedding": result["embedding"],
                     }
                 )
 
+        if stored_points:
+            point_ids = self.store_embeddings_batch(
+                [(p["text"], p["embedding"], p["metadata"]) for p in stored_points]
+            )
+            for stored_point, point_id in zip(stored_points, point_ids):
+                stored_point["point_id"] = point_id
+
         logger.success(f"✅ Stored {len(stored_points)} embeddings with metadata")
 
         # Test 1: Get collection metadata statistics
         logger.info("\n🔍 Test 1: Collection Metadata Statistics")
         metadata_stats = self.get_collection_metadata_stats()
-        logger.info(
-            f"📊 Collection stats: {json.dumps(metadata_stats, indent=2, default=str)}"
-        )
+        stats_json = orjson.dumps(
+            metadata_stats,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=str,
+        ).decode()
+        logger.info(f"📊 Collection stats: {stats_json}")
 
         # Test 2: Search by metadata only (no vector similarity)
         logger.info("\n🔍 Test 2: Metadata-Only Search")
@@ -1120,9 +1653,11 @@ class OllamaEmbeddingTester:
             {"tech_score": {"gt": 0.1}},
         ]
 
-        for search_filter in metadata_searches:
+        metadata_search_results = self.search_by_metadata_batch(
+            metadata_searches, limit=5
+        )
+        for search_filter, results in zip(metadata_searches, metadata_search_results):
             logger.info(f"Searching with filter: {search_filter}")
-            results = self.search_by_metadata_only(search_filter, limit=5)
             logger.info(f"Found {len(results)} results")
             for result in results:
                 logger.info(
@@ -1158,9 +1693,15 @@ class OllamaEmbeddingTester:
         logger.info("\n🔍 Test 4: Metadata Analysis")
 
         # Find embeddings with specific characteristics
-        tech_embeddings = self.search_by_metadata_only({"tech_score": {"gte": 0.2}})
-        short_embeddings = self.search_by_metadata_only({"word_count": {"lte": 5}})
-        url_embeddings = self.search_by_metadata_only({"has_urls": True})
+        tech_embeddings, short_embeddings, url_embeddings = (
+            self.search_by_metadata_batch(
+                [
+                    {"tech_score": {"gte": 0.2}},
+                    {"word_count": {"lte": 5}},
+                    {"has_urls": True},
+                ]
+            )
+        )
 
         logger.info("📊 Analysis results:")
         logger.info(f"  - High tech content: {len(tech_embeddings)} embeddings")
@@ -1171,7 +1712,7 @@ class OllamaEmbeddingTester:
         self.log_test_result(
             "metadata_storage_and_search",
             {
-                "test_texts_count": len(test_texts_with_metadata),
+                "test_texts_count": len(TEST_TEXTS_WITH_METADATA),
                 "stored_points_count": len(stored_points),
                 "collection_metadata_stats": metadata_stats,
                 "metadata_only_searches": len(metadata_searches),
@@ -1199,8 +1740,8 @@ class OllamaEmbeddingTester:
             {"embedding_norm": {"gte": 1.0}},  # Normalized embeddings
         ]
 
-        for query in range_queries:
-            results = self.search_by_metadata_only(query, limit=10)
+        range_results = self.search_by_metadata_batch(range_queries, limit=10)
+        for query, results in zip(range_queries, range_results):
             logger.info(f"Range query {query}: {len(results)} results")
 
         # Test multiple condition queries
@@ -1234,8 +1775,8 @@ class OllamaEmbeddingTester:
         ]
 
         pattern_results = {}
-        for i, pattern in enumerate(patterns):
-            results = self.search_by_metadata_only(pattern, limit=20)
+        pattern_matches = self.search_by_metadata_batch(patterns, limit=20)
+        for i, (pattern, results) in enumerate(zip(patterns, pattern_matches)):
             pattern_results[f"pattern_{i + 1}"] = len(results)
             logger.info(f"Pattern {i + 1} {pattern}: {len(results)} results")
 
@@ -1253,174 +1794,176 @@ class OllamaEmbeddingTester:
         logger.success("✅ Advanced metadata query testing completed")
 
 
+def load_embedding_vectors(embeddings_file: str, dimension: int = 1024) -> np.ndarray:
+    """Load the float32 embedding sidecar written by OllamaEmbeddingTester.
+
+    Row ``i`` corresponds to the ``embedding_index`` recorded in the JSON log.
+    """
+    return np.fromfile(embeddings_file, dtype=np.float32).reshape(-1, dimension)
+
+
 async def run_comprehensive_tests():
     """Run all embedding tests."""
     logger.info("Starting comprehensive Ollama embedding tests")
 
-    tester = OllamaEmbeddingTester()
-
-    # Test 1: Model accessibility
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 1: Model Information & Accessibility")
-    logger.info("=" * 60)
-    model_info = await tester.test_model_info()
-    logger.info(f"Model info: {model_info}")
-
-    if not model_info.get("model_accessible", False):
-        logger.error("Model not accessible. Cannot proceed with further tests.")
-        logger.error(f"Error: {model_info.get('error', 'Unknown error')}")
-        return
-
-    # Test 2: Single embedding
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 2: Single Embedding Generation")
-    logger.info("=" * 60)
-    single_result = await tester.test_single_embedding(
-        "This is a test sentence for embedding generation."
-    )
-
-    # Test 3: Batch embeddings
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 3: Batch Embedding Generation")
-    logger.info("=" * 60)
-    test_texts = [
-        "Artificial intelligence is transforming technology.",
-        "Machine learning models require large datasets.",
-        "Natural language processing enables text understanding.",
-        "Deep learning neural networks are powerful tools.",
-        "Computer vision can analyze images automatically.",
-        "Reinforcement learning trains agents through rewards.",
-        "Large language models understand human text.",
-        "Data science combines statistics and programming.",
-        "Cloud computing provides scalable infrastructure.",
-        "Blockchain technology ensures secure transactions.",
-        "Internet of Things connects everyday devices.",
-        "Quantum computing promises exponential speedups.",
-        "Cybersecurity protects against digital threats.",
-        "Big data analytics reveals hidden patterns.",
-        "Edge computing processes data locally.",
-        "Virtual reality creates immersive experiences.",
-        "Augmented reality overlays digital information.",
-        "5G networks enable ultra-fast connectivity.",
-        "Autonomous vehicles navigate without drivers.",
-        "Robotics automates physical tasks efficiently.",
-    ]
-    logger.info(
-        f"📊 Generating embeddings for {len(test_texts)} diverse technology texts"
-    )
-    batch_result = await tester.test_batch_embeddings(test_texts)
-
-    # Test 4: Similarity analysis
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 4: Semantic Similarity Analysis")
-    logger.info("=" * 60)
-    await tester.test_similarity_analysis()
-
-    # Test 5: Qdrant similarity search
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 5: Qdrant Similarity Search")
-    logger.info("=" * 60)
-    await tester.test_qdrant_similarity_search()
-
-    # Test 6: Metadata storage and search
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 6: Metadata Storage and Search")
-    logger.info("=" * 60)
-    await tester.test_metadata_storage_and_search()
-
-    # Test 7: Advanced metadata queries
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 7: Advanced Metadata Queries")
-    logger.info("=" * 60)
-    await tester.test_advanced_metadata_queries()
-
-    # Test 8: Final Qdrant collection status
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST 8: Final Qdrant Collection Status")
-    logger.info("=" * 60)
-
-    try:
-        final_collection_info = tester.qdrant_client.get_collection(
-            tester.collection_name
-        )
-        final_count = final_collection_info.points_count or 0
-        logger.success("📊 Final Qdrant collection status:")
-        logger.info(f"   🔹 Collection: {tester.collection_name}")
-        logger.info(f"   🔹 Total embeddings stored: {final_count}")
-        logger.info(
-            f"   🔹 Vector dimension: {final_collection_info.config.params.vectors.size}"
-        )
+    async with OllamaEmbeddingTester() as tester:
+        # Test 1: Model accessibility
+        logger.info("\n" + "=" * 60)
+        logger.info("TEST 1: Model Information & Accessibility")
+        logger.info("=" * 60)
+        model_info = await tester.test_model_info()
+        logger.info(f"Model info: {model_info}")
+
+        if not model_info.get("model_accessible", False):
+            logger.error("Model not accessible. Cannot proceed with further tests.")
+            logger.error(f"Error: {model_info.get('error', 'Unknown error')}")
+            return
+
+        # Test 2: Single embedding
+        logger.info("\n" + "=" * 60)
+        logger.info("TEST 2: Single Embedding Generation")
+        logger.info("=" * 60)
+        single_result = await tester.test_single_embedding(SINGLE_EMBEDDING_TEST_TEXT)
+
+        # Test 3: Batch embeddings
+        logger.info("\n" + "=" * 60)
+        logger.info("TEST 3: Batch Embedding Generation")
+        logger.info("=" * 60)
+        test_texts = [
+            "Artificial intelligence is transforming technology.",
+            "Machine learning models require large datasets.",
+            "Natural language processing enables text understanding.",
+            "Deep learning neural networks are powerful tools.",
+            "Computer vision can analyze images automatically.",
+            "Reinforcement learning trains agents through rewards.",
+            "Large language models understand human text.",
+            "Data science combines statistics and programming.",
+            "Cloud computing provides scalable infrastructure.",
+            "Blockchain technology ensures secure transactions.",
+            "Internet of Things connects everyday devices.",
+            "Quantum computing promises exponential speedups.",
+            "Cybersecurity protects against digital threats.",
+            "Big data analytics reveals hidden patterns.",
+            "Edge computing processes data locally.",
+            "Virtual reality creates immersive experiences.",
+            "Augmented reality overlays digital information.",
+            "5G networks enable ultra-fast connectivity.",
+            "Autonomous vehicles navigate without drivers.",
+            "Robotics automates physical tasks efficiently.",
+        ]
         logger.info(
-            f"   🔹 Distance metric: {final_collection_info.config.params.vectors.distance}"
-        )
-
-        tester.log_test_result(
-            "final_collection_status",
-            {
-                "collection_name": tester.collection_name,
-                "total_points": final_count,
-                "vector_dimension": final_collection_info.config.params.vectors.size,
-                "distance_metric": str(
-                    final_collection_info.config.params.vectors.distance
-                ),
-            },
+            f"📊 Generating embeddings for {len(test_texts)} diverse technology texts"
         )
-    except Exception as e:
-        logger.error(f"❌ FATAL: Failed to get final collection status: {str(e)}")
-        raise SystemExit(f"Qdrant collection status check failed: {str(e)}")
-
-    # Summary
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST SUMMARY")
-    logger.info("=" * 60)
-    logger.success(f"✅ Model: {model_info['model_name']}")
-    logger.success(f"✅ Ollama URL: {model_info['ollama_url']}")
-    logger.success(
-        f"✅ Vector Dimension: {model_info.get('vector_dimension', 'Unknown')}"
-    )
+        batch_result = await tester.test_batch_embeddings(test_texts)
+
+        # Test 4: Similarity analysis
+        logger.info("\n" + "=" * 60)
+        logger.info("TEST 4: Semantic Similarity Analysis")
+        logger.info("=" * 60)
+        await tester.test_similarity_analysis()
+
+        # Test 5: Qdrant similarity search
+        logger.info("\n" + "=" * 60)
+        logger.info("TEST 5: Qdrant Similarity Search")
+        logger.info("=" * 60)
+        await tester.test_qdrant_similarity_search()
+
+        # Test 6: Metadata storage and search
+        logger.info("\n" + "=" * 60)
+        logger.info("TEST 6: Metadata Storage and Search")
+        logger.info("=" * 60)
+        await tester.test_metadata_storage_and_search()
+
+        # Test 7: Advanced metadata queries
+        logger.info("\n" + "=" * 60)
+        logger.info("TEST 7: Advanced Metadata Queries")
+        logger.info("=" * 60)
+        await tester.test_advanced_metadata_queries()
+
+        # Test 8: Final Qdrant collection status
+        logger.info("\n" + "=" * 60)
+        logger.info("TEST 8: Final Qdrant Collection Status")
+        logger.info("=" * 60)
 
-    logger.success(f"✅ Qdrant URL: {tester.qdrant_url}")
-    logger.success(f"✅ Qdrant Collection: {tester.collection_name}")
+        try:
+            final_collection_info = tester.qdrant_client.get_collection(
+                tester.collection_name
+            )
+            final_count = final_collection_info.points_count or 0
+            logger.success("📊 Final Qdrant collection status:")
+            logger.info(f"   🔹 Collection: {tester.collection_name}")
+            logger.info(f"   🔹 Total embeddings stored: {final_count}")
+            logger.info(
+                f"   🔹 Vector dimension: {final_collection_info.config.params.vectors.size}"
+            )
+            logger.info(
+                f"   🔹 Distance metric: {final_collection_info.config.params.vectors.distance}"
+            )
 
-    if single_result["success"]:
+            tester.log_test_result(
+                "final_collection_status",
+                {
+                    "collection_name": tester.collection_name,
+                    "total_points": final_count,
+                    "vector_dimension": final_collection_info.config.params.vectors.size,
+                    "distance_metric": str(
+                        final_collection_info.config.params.vectors.distance
+                    ),
+                },
+            )
+        except Exception as e:
+            logger.error(f"❌ FATAL: Failed to get final collection status: {str(e)}")
+            raise SystemExit(f"Qdrant collection status check failed: {str(e)}")
+
+        # Summary
+        logger.info("\n" + "=" * 60)
+        logger.info("TEST SUMMARY")
+        logger.info("=" * 60)
+        logger.success(f"✅ Model: {model_info['model_name']}")
+        logger.success(f"✅ Ollama URL: {model_info['ollama_url']}")
         logger.success(
-            f"✅ Single embedding: {single_result['stats']['generation_time']:.2f}s"
+            f"✅ Vector Dimension: {model_info.get('vector_dimension', 'Unknown')}"
         )
-    else:
-        logger.error(f"❌ Single embedding failed: {single_result.get('error')}")
 
-    if batch_result["success"]:
-        stats = batch_result["batch_stats"]
-        logger.success(
-            f"✅ Batch embeddings: {stats['successful_embeddings']}/{stats['total_texts']} successful"
-        )
-        logger.success(
-            f"✅ Batch throughput: {stats['throughput_per_second']:.2f} embeddings/sec"
-        )
+        logger.success(f"✅ Qdrant URL: {tester.qdrant_url}")
+        logger.success(f"✅ Qdrant Collection: {tester.collection_name}")
 
-        successful_stores = len(
-            [
-                t
-                for t in tester.test_results["tests"]
-                if t["test_type"] == "single_embedding"
-                and t["data"].get("qdrant_point_id") is not None
-            ]
-        )
-        logger.success(
-            f"✅ Qdrant storage: {successful_stores} embeddings successfully stored"
-        )
-    else:
-        logger.error(f"❌ Batch embeddings failed: {batch_result.get('error')}")
+        if single_result["success"]:
+            logger.success(
+                f"✅ Single embedding: {single_result['stats']['generation_time']:.2f}s"
+            )
+        else:
+            logger.error(f"❌ Single embedding failed: {single_result.get('error')}")
 
-    # Save all test results to file
-    tester.save_results_to_file()
-    logger.success(f"💾 All test results saved to: {tester.log_file}")
+        if batch_result["success"]:
+            stats = batch_result["batch_stats"]
+            logger.success(
+                f"✅ Batch embeddings: {stats['successful_embeddings']}/{stats['total_texts']} successful"
+            )
+            logger.success(
+                f"✅ Batch throughput: {stats['throughput_per_second']:.2f} embeddings/sec"
+            )
 
-    logger.success(
-        f"🔍 Qdrant embeddings available for similarity search in collection: {tester.collection_name}"
-    )
+            logger.success(
+                f"✅ Qdrant storage: {tester._stored_embedding_count} embeddings successfully stored"
+            )
+        else:
+            logger.error(f"❌ Batch embeddings failed: {batch_result.get('error')}")
+
+        # Save all test results to file
+        tester.save_results_to_file()
+        logger.success(f"💾 All test results saved to: {tester.log_file}")
+
+        logger.success(
+            f"🔍 Qdrant embeddings available for similarity search in collection: {tester.collection_name}"
+        )
 
 
 if __name__ == "__main__":
+    # Configure logging - enqueue so log I/O happens off the event loop thread
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", enqueue=True)
+
     # Run the tests
     asyncio.run(run_comprehensive_tests())
+    logger.complete()
@@ -1,7 +1,11 @@
 import whisperx
-import gc
 import torch
 import os
+import bisect
+import itertools
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from whisperx.audio import SAMPLE_RATE
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,8 +17,28 @@ if not torch.cuda.is_available():
     raise RuntimeError("CUDA is not available. GPU is required for this script.")
 
 DEVICE = "cuda"
+DEVICE_INDEX = 0
 COMPUTE_TYPE = "float16"
 BATCH_SIZE = 16
+ASR_MODEL_NAME = "medium"
+# Silence between clips transcribed together; must be at least WhisperX's
+# 30 second VAD chunk size so no chunk spans two clips
+CLIP_GAP_SECONDS = 30
+# Default speaker-count bounds for diarization; narrowing them prunes the
+# candidate cluster counts pyannote has to score
+MIN_SPEAKERS = 1
+MAX_SPEAKERS = 8
+
+# Loaded models, kept resident on the GPU across transcribe_and_diarize_whisperx
+# calls so each file only pays for inference, not for loading weights. Nothing
+# calls torch.cuda.empty_cache(): the cached models and the next file's
+# activations rely on the allocator's blocks staying resident, and emptying
+# the cache would hand that memory back to the driver only to re-request it.
+_MODEL_CACHE = {}
+
+# Pin the CUDA device once, before anything allocates, so every stage uses the
+# same context and no stray context is created on another device
+torch.cuda.set_device(DEVICE_INDEX)
 
 print(f"Using device: {DEVICE}")
 print(f"Compute type: {COMPUTE_TYPE}")
@@ -22,110 +46,351 @@ print(f"CUDA devices available: {torch.cuda.device_count()}")
 print(f"Current CUDA device: {torch.cuda.current_device()}")
 print(f"CUDA device name: {torch.cuda.get_device_name()}")
 
-# Set environment variables to potentially help with cuDNN issues
-os.environ["CUDNN_DETERMINISTIC"] = "1"
-os.environ["CUDNN_BENCHMARK"] = "0"
+# Input shapes are fixed (16 kHz audio, fixed-size mel windows), so let cuDNN
+# autotune its convolution algorithms once and reuse them; this also covers
+# the SincNet/Conv1D front end of pyannote's segmentation model
+torch.backends.cudnn.benchmark = True
+torch.backends.cudnn.deterministic = False
 
 
-def transcribe_and_diarize_whisperx(audio_path: str, language: str = "en"):
+def get_asr_model():
+    """Return the cached WhisperX ASR model, loading it on first use."""
+    key = ("asr", ASR_MODEL_NAME, DEVICE, COMPUTE_TYPE)
+    if key not in _MODEL_CACHE:
+        _MODEL_CACHE[key] = whisperx.load_model(
+            ASR_MODEL_NAME, DEVICE, compute_type=COMPUTE_TYPE
+        )
+    return _MODEL_CACHE[key]
+
+
+def get_align_model(language: str):
+    """Return the cached (alignment model, metadata) pair for a language."""
+    key = ("align", language, DEVICE)
+    if key not in _MODEL_CACHE:
+        _MODEL_CACHE[key] = whisperx.load_align_model(
+            language_code=language, device=DEVICE
+        )
+    return _MODEL_CACHE[key]
+
+
+def get_diarize_model():
+    """Return the cached WhisperX diarization pipeline."""
+    key = ("diarize", DEVICE)
+    if key not in _MODEL_CACHE:
+        _MODEL_CACHE[key] = whisperx.DiarizationPipeline(
+            use_auth_token=HF_TOKEN, device=DEVICE
+        )
+    return _MODEL_CACHE[key]
+
+
+def get_pyannote_pipeline():
+    """Return the cached pyannote pipeline used when WhisperX lacks diarization."""
+    key = ("pyannote", DEVICE)
+    if key not in _MODEL_CACHE:
+        from pyannote.audio import Pipeline
+
+        pipeline = Pipeline.from_pretrained(
+            "pyannote/speaker-diarization-3.1", use_auth_token=HF_TOKEN
+        )
+        pipeline.to(torch.device(DEVICE))
+        _MODEL_CACHE[key] = pipeline
+    return _MODEL_CACHE[key]
+
+
+def get_stream(name: str):
+    """Return the cached CUDA stream used for one pipeline stage."""
+    key = ("stream", name, DEVICE_INDEX)
+    if key not in _MODEL_CACHE:
+        _MODEL_CACHE[key] = torch.cuda.Stream(device=DEVICE_INDEX)
+    return _MODEL_CACHE[key]
+
+
+def warmup(language: str = "en"):
+    """
+    Preload the ASR, alignment and diarization models before the first file.
+
+    Args:
+        language (str): Language code whose alignment model should be loaded
     """
-    Transcribes an audio file and performs speaker diarization using WhisperX.
+    get_asr_model()
+    get_align_model(language)
+    try:
+        get_diarize_model()
+    except AttributeError:
+        get_pyannote_pipeline()
+
+
+def transcribe_and_diarize_whisperx(
+    audio_paths: list,
+    language: str = "en",
+    min_speakers: int = MIN_SPEAKERS,
+    max_speakers: int = MAX_SPEAKERS,
+    num_speakers: int = None,
+):
+    """
+    Transcribes audio files and performs speaker diarization using WhisperX.
     Uses the CORRECT WhisperX API approach - no hacks.
 
+    Files are sorted by duration and transcribed in buckets of up to BATCH_SIZE
+    clips: each bucket is joined into one waveform (separated by silence) and
+    sent through a single batched model.transcribe call, so short clips fill
+    the GPU batch together. Alignment and diarization then run per clip on
+    the same cached models.
+
     Args:
-        audio_path (str): Path to the audio file
-        language (str): Language code (e.g., "en", "es", "fr"). Use "auto" for auto-detection.
+        audio_paths (list): Paths to the audio files
+        language (str): Language code (e.g., "en", "es", "fr"). Use "auto" for
+            auto-detection, which is done separately for every clip.
+        min_speakers (int): Lower bound on the number of speakers per clip
+        max_speakers (int): Upper bound on the number of speakers per clip
+        num_speakers (int, optional): Exact number of speakers per clip, when
+            known (e.g. 2 for an interview); overrides the bounds
 
     Returns:
-        list: List of segments with speaker labels, timestamps, and text
+        dict: Maps each audio path to its list of segments with speaker labels,
+            timestamps, and text
     """
-    if not os.path.exists(audio_path):
-        raise FileNotFoundError(f"Audio file not found at: {audio_path}")
+    for audio_path in audio_paths:
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found at: {audio_path}")
 
     print("Step 1: Loading WhisperX model on GPU...")
 
     # Force GPU usage - fail if it doesn't work
     try:
-        # Test CUDA operations first
-        test_tensor = torch.randn(10, 10).cuda()
-        print(f"✓ CUDA tensor creation successful on device: {test_tensor.device}")
-        del test_tensor
-        torch.cuda.empty_cache()
-
-        # 1. Load WhisperX model - MUST be on GPU
-        model = whisperx.load_model("medium", DEVICE, compute_type=COMPUTE_TYPE)
+        # 1. Load WhisperX model - MUST be on GPU (reused across calls)
+        model = get_asr_model()
         print("✓ WhisperX model loaded successfully on GPU")
 
     except Exception as e:
         raise RuntimeError(f"Failed to load model on GPU: {e}")
 
-    # 2. Load audio and transcribe
+    # 2. Load audio and transcribe, grouping clips of similar duration
     print("Step 2: Loading and transcribing audio on GPU...")
     try:
-        audio = whisperx.load_audio(audio_path)
-        result = model.transcribe(audio, batch_size=BATCH_SIZE)
-        print("✓ Audio transcribed successfully on GPU")
+        audios = {path: whisperx.load_audio(path) for path in audio_paths}
+
+        # A bucket is transcribed in a single language, so detect each clip's
+        # language on its own before grouping; otherwise one clip's detection
+        # would be applied to every clip it shares a bucket with
+        if language == "auto":
+            languages = {
+                path: model.detect_language(audios[path]) for path in audio_paths
+            }
+        else:
+            languages = dict.fromkeys(audio_paths, language)
+
+        ordered_paths = sorted(
+            audio_paths, key=lambda path: (languages[path], len(audios[path]))
+        )
+        transcriptions = {}
+        for clip_language, group in itertools.groupby(ordered_paths, key=languages.get):
+            group = list(group)
+            for i in range(0, len(group), BATCH_SIZE):
+                bucket = group[i : i + BATCH_SIZE]
+                transcriptions.update(
+                    transcribe_bucket(
+                        model, [audios[path] for path in bucket], bucket, clip_language
+                    )
+                )
+        print(f"✓ {len(audio_paths)} audio file(s) transcribed successfully on GPU")
     except Exception as e:
         raise RuntimeError(f"Failed to transcribe audio on GPU: {e}")
 
+    outputs = {}
+    for audio_path in audio_paths:
+        print(f"Processing {audio_path}...")
+        outputs[audio_path] = align_and_diarize(
+            audios[audio_path],
+            transcriptions[audio_path],
+            language,
+            min_speakers=min_speakers,
+            max_speakers=max_speakers,
+            num_speakers=num_speakers,
+        )
+
+    print("✓ Processing complete - ALL OPERATIONS ON GPU")
+    return outputs
+
+
+@torch.inference_mode()
+def transcribe_bucket(model, audios: list, audio_paths: list, language: str):
+    """
+    Transcribe several waveforms with one batched WhisperX call, under
+    torch.inference_mode().
+
+    The clips are joined with CLIP_GAP_SECONDS of silence. WhisperX merges VAD
+    regions into windows of at most 30 seconds, so a gap at least that long
+    keeps every window inside a single clip; segments are then mapped back to
+    their clip and re-based to its start.
+
+    Args:
+        model: Loaded WhisperX ASR model
+        audios (list): Waveforms sampled at whisperx.audio.SAMPLE_RATE
+        audio_paths (list): Paths matching ``audios``, used as result keys
+        language (str): Language code shared by every clip in the bucket
+
+    Returns:
+        dict: Maps each path to a transcription result with "segments" and
+            "language"
+    """
+    gap = np.zeros(int(CLIP_GAP_SECONDS * SAMPLE_RATE), dtype=np.float32)
+    pieces = []
+    offsets = []
+    position = 0
+    for audio in audios:
+        offsets.append(position / SAMPLE_RATE)
+        pieces.extend((audio, gap))
+        position += len(audio) + len(gap)
+
+    # The trailing gap after the last clip is dropped
+    result = model.transcribe(
+        np.concatenate(pieces[:-1]), batch_size=BATCH_SIZE, language=language
+    )
+
+    transcriptions = {
+        path: {"segments": [], "language": result["language"]} for path in audio_paths
+    }
+    for segment in result["segments"]:
+        index = bisect.bisect_right(offsets, segment["start"]) - 1
+        offset = offsets[index]
+        transcriptions[audio_paths[index]]["segments"].append(
+            {
+                **segment,
+                "start": segment["start"] - offset,
+                "end": segment["end"] - offset,
+            }
+        )
+    return transcriptions
+
+
+@torch.inference_mode()
+def diarize_clip(stream, audio, waveform, speaker_hints: dict):
+    """
+    Diarize one clip on the given CUDA stream.
+
+    Runs in a worker thread next to alignment, so it enters
+    torch.inference_mode() itself rather than inheriting it from the caller.
+
+    Args:
+        stream (torch.cuda.Stream): Stream to queue the diarization kernels on
+        audio: 16 kHz mono waveform from whisperx.load_audio
+        waveform (torch.Tensor): Pinned tensor copy of ``audio``
+        speaker_hints (dict): num_speakers/min_speakers/max_speakers keywords
+
+    Returns:
+        pyannote.core.Annotation: Speaker turns for the clip
+    """
+    with torch.cuda.stream(stream):
+        # 4. Speaker Diarization - THE CORRECT WAY
+        print("Step 4: Performing speaker diarization on GPU...")
+        try:
+            # Load diarization model - this is the correct WhisperX approach; it
+            # takes the in-memory waveform, so the file is not read again
+            diarize_model = get_diarize_model()
+            diarize_segments = diarize_model(audio, **speaker_hints)
+            print("✓ Speaker diarization completed on GPU")
+
+        except AttributeError:
+            # If DiarizationPipeline doesn't exist, try the newer API
+            print("  - Trying alternative diarization API...")
+            try:
+                diarize_model = get_pyannote_pipeline()
+
+                # Pass the already-loaded waveform instead of the file path so
+                # pyannote does not decode and resample the file a second time
+                diarize_segments = diarize_model(
+                    {"waveform": waveform.unsqueeze(0), "sample_rate": SAMPLE_RATE},
+                    **speaker_hints,
+                )
+                print("✓ Speaker diarization completed using pyannote directly")
+
+            except Exception as e:
+                raise RuntimeError(f"Failed to perform diarization: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to perform diarization on GPU: {e}")
+
+    return diarize_segments
+
+
+@torch.inference_mode()
+def align_and_diarize(
+    audio,
+    result: dict,
+    language: str,
+    min_speakers: int = MIN_SPEAKERS,
+    max_speakers: int = MAX_SPEAKERS,
+    num_speakers: int = None,
+):
+    """
+    Align, diarize and label one transcribed clip.
+
+    Runs under torch.inference_mode(), since nothing here needs autograd.
+
+    Args:
+        audio: 16 kHz mono waveform from whisperx.load_audio
+        result (dict): Transcription result for this clip
+        language (str): Language code, or "auto" to use the detected language
+        min_speakers (int): Lower bound on the number of speakers
+        max_speakers (int): Upper bound on the number of speakers
+        num_speakers (int, optional): Exact number of speakers, if known
+
+    Returns:
+        list: List of segments with speaker labels, start/end times in seconds
+            (floats), and text
+    """
     # Auto-detect language if not specified
     if language == "auto":
         language = result["language"]
         print(f"Detected language: {language}")
 
-    # 3. Align whisper output for better timestamp accuracy
-    print("Step 3: Aligning timestamps on GPU...")
-    try:
-        model_a, metadata = whisperx.load_align_model(
-            language_code=language, device=DEVICE
-        )
-        result = whisperx.align(
-            result["segments"],
-            model_a,
-            metadata,
-            audio,
-            DEVICE,
-            return_char_alignments=False,
-        )
-        print("✓ Timestamp alignment completed on GPU")
-
-        # Memory cleanup after alignment
-        del model_a
-        gc.collect()
-        torch.cuda.empty_cache()
+    # One page-locked float32 copy of the waveform is shared by alignment and
+    # the pyannote fallback, so host-to-device copies use DMA. It stays float32:
+    # the wav2vec2 aligner and pyannote run in float32 and reject half input.
+    waveform = torch.from_numpy(audio).pin_memory()
 
-    except Exception as e:
-        raise RuntimeError(f"Failed to align timestamps on GPU: {e}")
+    # Both diarization APIs accept the same speaker-count hints
+    speaker_hints = {
+        "num_speakers": num_speakers,
+        "min_speakers": min_speakers,
+        "max_speakers": max_speakers,
+    }
 
-    # 4. Speaker Diarization - THE CORRECT WAY
-    print("Step 4: Performing speaker diarization on GPU...")
+    # Load every model before either stream starts, so neither side allocates
+    # weights while the other is running
     try:
-        # Load diarization model - this is the correct WhisperX approach
-        diarize_model = whisperx.DiarizationPipeline(
-            use_auth_token=HF_TOKEN, device=DEVICE
+        warmup(language)
+    except Exception as e:
+        raise RuntimeError(f"Failed to load alignment/diarization models: {e}")
+
+    # 3 + 4. Alignment only needs the transcription and diarization only needs
+    # the audio, so diarization runs in a worker thread on its own CUDA stream
+    # while alignment runs here on another, letting their kernels overlap
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        diarization = executor.submit(
+            diarize_clip, get_stream("diarize"), audio, waveform, speaker_hints
         )
-        diarize_segments = diarize_model(audio)
-        print("✓ Speaker diarization completed on GPU")
 
-    except AttributeError:
-        # If DiarizationPipeline doesn't exist, try the newer API
-        print("  - Trying alternative diarization API...")
+        print("Step 3: Aligning timestamps on GPU...")
         try:
-            from pyannote.audio import Pipeline
+            model_a, metadata = get_align_model(language)
+            with torch.cuda.stream(get_stream("align")):
+                result = whisperx.align(
+                    result["segments"],
+                    model_a,
+                    metadata,
+                    waveform,
+                    DEVICE,
+                    return_char_alignments=False,
+                )
+            print("✓ Timestamp alignment completed on GPU")
 
-            diarize_model = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1", use_auth_token=HF_TOKEN
-            )
-            diarize_model.to(torch.device(DEVICE))
+        except Exception as e:
+            raise RuntimeError(f"Failed to align timestamps on GPU: {e}")
 
-            # For pyannote, we need to pass the audio file path
-            diarize_segments = diarize_model(audio_path)
-            print("✓ Speaker diarization completed using pyannote directly")
+        diarize_segments = diarization.result()
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to perform diarization: {e}")
-    except Exception as e:
-        raise RuntimeError(f"Failed to perform diarization on GPU: {e}")
+    torch.cuda.synchronize()
 
     # 5. Assign speaker labels - FIXED FOR WHISPERX 3.4.2
     print("Step 5: Assigning speakers to segments...")
@@ -134,12 +399,19 @@ def transcribe_and_diarize_whisperx(audio_path: str, language: str = "en"):
         import pandas as pd
 
         def annotation_to_df(annotation):
-            segments = []
+            # Build the frame column by column rather than from per-turn dicts
+            starts, ends, speakers = [], [], []
             for segment, _, speaker in annotation.itertracks(yield_label=True):
-                segments.append(
-                    {"start": segment.start, "end": segment.end, "speaker": speaker}
-                )
-            return pd.DataFrame(segments)
+                starts.append(segment.start)
+                ends.append(segment.end)
+                speakers.append(speaker)
+            return pd.DataFrame(
+                {
+                    "start": np.fromiter(starts, dtype=np.float64, count=len(starts)),
+                    "end": np.fromiter(ends, dtype=np.float64, count=len(ends)),
+                    "speaker": speakers,
+                }
+            )
 
         # Convert annotation to DataFrame format expected by assign_word_speakers
         diarization_df = annotation_to_df(diarize_segments)
@@ -150,11 +422,11 @@ def transcribe_and_diarize_whisperx(audio_path: str, language: str = "en"):
         print("✓ Speaker assignment completed")
 
         # Verify assignment worked
-        speakers_found = set()
-        for segment in result["segments"]:
-            speaker = segment.get("speaker")
-            if speaker and speaker != "UNKNOWN":
-                speakers_found.add(speaker)
+        speakers_found = {
+            speaker
+            for speaker in (segment.get("speaker") for segment in result["segments"])
+            if speaker and speaker != "UNKNOWN"
+        }
 
         print(
             f"✓ Successfully assigned {len(speakers_found)} speakers: {speakers_found}"
@@ -163,15 +435,6 @@ def transcribe_and_diarize_whisperx(audio_path: str, language: str = "en"):
     except Exception as e:
         raise RuntimeError(f"Failed to assign speakers: {e}")
 
-    # Memory cleanup
-    try:
-        del model, diarize_model
-        gc.collect()
-        torch.cuda.empty_cache()
-        print("✓ GPU memory cleaned up successfully")
-    except Exception as e:
-        print(f"Warning: GPU memory cleanup had issues: {e}")
-
     # 6. Format the final output
     final_output = []
     for segment in result["segments"]:
@@ -181,13 +444,12 @@ def transcribe_and_diarize_whisperx(audio_path: str, language: str = "en"):
         final_output.append(
             {
                 "speaker": speaker,
-                "start_time": f"{segment['start']:.2f}s",
-                "end_time": f"{segment['end']:.2f}s",
+                "start": float(segment["start"]),
+                "end": float(segment["end"]),
                 "text": segment["text"].strip(),
             }
         )
 
-    print("✓ Processing complete - ALL OPERATIONS ON GPU")
     return final_output
 
 
@@ -199,21 +461,24 @@ def save_transcription(segments, output_path: str):
         segments (list): List of transcribed segments with speaker labels
         output_path (str): Path where to save the transcription
     """
+    lines = ["=== TRANSCRIPTION WITH SPEAKER DIARIZATION (GPU-PROCESSED) ===\n\n"]
+
+    current_speaker = None
+    for segment in segments:
+        # Add a separator when speaker changes
+        if segment["speaker"] != current_speaker:
+            if current_speaker is not None:
+                lines.append("\n")
+            lines.append(f"--- {segment['speaker']} ---\n")
+            current_speaker = segment["speaker"]
+
+        lines.append(
+            f"[{segment['start']:.2f}s -> {segment['end']:.2f}s] {segment['text']}\n"
+        )
+
+    # Write the whole transcript in one call
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write("=== TRANSCRIPTION WITH SPEAKER DIARIZATION (GPU-PROCESSED) ===\n\n")
-
-        current_speaker = None
-        for segment in segments:
-            # Add a separator when speaker changes
-            if segment["speaker"] != current_speaker:
-                if current_speaker is not None:
-                    f.write("\n")
-                f.write(f"--- {segment['speaker']} ---\n")
-                current_speaker = segment["speaker"]
-
-            f.write(
-                f"[{segment['start_time']} -> {segment['end_time']}] {segment['text']}\n"
-            )
+        f.write("".join(lines))
 
 
 def get_speaker_stats(segments):
@@ -226,27 +491,29 @@ def get_speaker_stats(segments):
     Returns:
         dict: Speaker statistics
     """
-    speaker_stats = {}
-
-    for segment in segments:
-        speaker = segment["speaker"]
-        if speaker not in speaker_stats:
-            speaker_stats[speaker] = {
-                "segment_count": 0,
-                "total_duration": 0.0,
-                "word_count": 0,
-            }
-
-        # Calculate duration
-        start = float(segment["start_time"].replace("s", ""))
-        end = float(segment["end_time"].replace("s", ""))
-        duration = end - start
-
-        speaker_stats[speaker]["segment_count"] += 1
-        speaker_stats[speaker]["total_duration"] += duration
-        speaker_stats[speaker]["word_count"] += len(segment["text"].split())
-
-    return speaker_stats
+    if not segments:
+        return {}
+
+    import pandas as pd
+
+    # Aggregate all segments in one groupby instead of a per-segment loop
+    df = pd.DataFrame(segments)
+    df["duration"] = df["end"] - df["start"]
+    df["word_count"] = df["text"].str.split().str.len()
+
+    stats = df.groupby("speaker", sort=False).agg(
+        segment_count=("text", "size"),
+        total_duration=("duration", "sum"),
+        word_count=("word_count", "sum"),
+    )
+    return {
+        speaker: {
+            "segment_count": int(row.segment_count),
+            "total_duration": float(row.total_duration),
+            "word_count": int(row.word_count),
+        }
+        for speaker, row in stats.iterrows()
+    }
 
 
 if __name__ == "__main__":
@@ -260,15 +527,16 @@ if __name__ == "__main__":
     try:
         # Process the audio file
         tagged_transcription = transcribe_and_diarize_whisperx(
-            audio_file_path,
+            [audio_file_path],
             language="auto",  # or specify "en", "es", etc.
-        )
+            num_speakers=None,  # e.g. 2 for interview audio
+        )[audio_file_path]
 
         # Display results
         print("\n--- Final Tagged Transcription ---")
         for segment in tagged_transcription:
             print(
-                f"[{segment['start_time']} -> {segment['end_time']}] "
+                f"[{segment['start']:.2f}s -> {segment['end']:.2f}s] "
                 f"{segment['speaker']}: {segment['text']}"
             )
 
@@ -5,8 +5,11 @@ Test script for PersonaTranscriptionService
 
 import sys
 import os
+from itertools import islice
 from loguru import logger
-from services import PersonaTranscriptionService
+
+# File extensions accepted as test audio/video input
+MEDIA_EXTENSIONS = frozenset({".mp4", ".mp3", ".wav", ".m4a", ".avi", ".mov"})
 
 
 def setup_logging():
@@ -27,9 +30,14 @@ def test_persona_transcription():
     test_files = []
 
     if os.path.exists(source_files_dir):
-        for file in os.listdir(source_files_dir):
-            if file.lower().endswith((".mp4", ".mp3", ".wav", ".m4a", ".avi", ".mov")):
-                test_files.append(os.path.join(source_files_dir, file))
+        # scandir yields full paths and file types without extra stat calls
+        with os.scandir(source_files_dir) as entries:
+            test_files = [
+                entry.path
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and os.path.splitext(entry.name)[1].lower() in MEDIA_EXTENSIONS
+            ]
 
     if not test_files:
         logger.error("No audio/video files found in source-files directory for testing")
@@ -42,10 +50,15 @@ def test_persona_transcription():
     logger.info(f"Testing with file: {test_file}")
 
     try:
+        # Imported here so torch/whisperx load only once there is a file to
+        # transcribe
+        import torch
+        from services.transcription_service import PersonaTranscriptionService
+
         # Create PersonaTranscriptionService instance
         persona_service = PersonaTranscriptionService(
             default_model_size="small",  # Use smaller model for faster testing
-            device="cuda" if os.system("nvidia-smi > /dev/null 2>&1") == 0 else "cpu",
+            device="cuda" if torch.cuda.is_available() else "cpu",
         )
 
         # Perform persona transcription
@@ -58,16 +71,15 @@ def test_persona_transcription():
         # Display a preview of the results
         if os.path.exists(output_file):
             with open(output_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.split("\n")
-                preview_lines = lines[:20]  # Show first 20 lines
+                preview_lines = list(islice(f, 20))  # Show first 20 lines
+                remaining_lines = sum(1 for _ in f)
 
                 logger.info("Preview of transcription with personas:")
                 print("\n" + "=" * 60)
                 for line in preview_lines:
-                    print(line)
-                if len(lines) > 20:
-                    print(f"\n... and {len(lines) - 20} more lines")
+                    print(line.rstrip("\n"))
+                if remaining_lines:
+                    print(f"\n... and {remaining_lines} more lines")
                 print("=" * 60)
 
         return True
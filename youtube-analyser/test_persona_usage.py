@@ -5,9 +5,9 @@ Example usage of the PersonaTranscriptionService for speaker identification
 
 import sys
 import os
+from itertools import islice
 from loguru import logger
-from services import ConfigService
-from services.youtube_analyzer import YouTubeAnalyzer
+from services.config_service import ConfigService
 
 
 def setup_logging():
@@ -26,6 +26,9 @@ def main():
     setup_logging()
 
     try:
+        # The analyzer pulls in torch/whisperx, so import it only when running
+        from services.youtube_analyzer import YouTubeAnalyzer
+
         # Initialize services
         config_service = ConfigService()
         analyzer = YouTubeAnalyzer(config_service)
@@ -83,11 +86,11 @@ def main():
                 with open(
                     result_persona["transcription_file"], "r", encoding="utf-8"
                 ) as f:
-                    lines = f.read().split("\n")[:15]  # First 15 lines
+                    lines = list(islice(f, 15))  # First 15 lines
                     logger.info("Preview of persona transcription:")
                     print("\n" + "=" * 60)
                     for line in lines:
-                        print(line)
+                        print(line.rstrip("\n"))
                     print("=" * 60)
         else:
             logger.error(f"Persona transcription failed: {result_persona['error']}")
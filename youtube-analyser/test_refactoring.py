@@ -10,11 +10,13 @@ from loguru import logger
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Only the lightweight config service is imported up front; the download,
+# transcription and analyzer services pull in torch/whisperx, so the tests
+# that need them import them on demand
 try:
-    from services import ConfigService, YouTubeDownloadService, TranscriptionService
-    from services.youtube_analyzer import YouTubeAnalyzer
+    from services.config_service import ConfigService
 
-    logger.success("✅ All service imports successful")
+    logger.success("✅ Config service import successful")
 except ImportError as e:
     logger.error(f"❌ Import failed: {e}")
     sys.exit(1)
@@ -48,6 +50,10 @@ def test_service_creation():
     logger.info("Testing service creation...")
 
     try:
+        from services.youtube_download_service import YouTubeDownloadService
+        from services.transcription_service import TranscriptionService
+        from services.youtube_analyzer import YouTubeAnalyzer
+
         # Test creating services directly
         download_service = YouTubeDownloadService()
         transcription_service = TranscriptionService()
@@ -71,6 +77,8 @@ def test_analyzer_interface():
     logger.info("Testing analyzer interface...")
 
     try:
+        from services.youtube_analyzer import YouTubeAnalyzer
+
         # Create analyzer with default services
         analyzer = YouTubeAnalyzer()
 
@@ -94,6 +102,9 @@ def test_video_id_naming():
     logger.info("Testing video ID-based file naming...")
 
     try:
+        from services.youtube_download_service import YouTubeDownloadService
+        from services.transcription_service import TranscriptionService
+
         # Create services
         download_service = YouTubeDownloadService()
         transcription_service = TranscriptionService()
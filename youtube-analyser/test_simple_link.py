@@ -3,6 +3,7 @@
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from loguru import logger
 from services.bluesky_service import BlueskyService
@@ -24,6 +25,10 @@ def test_different_links():
     try:
         service = BlueskyService(handle, password, service_url)
 
+        # Log in once up front so the concurrent posts share one session
+        if not service.authenticate():
+            return False
+
         # Test different link types
         tests = [
             {
@@ -48,24 +53,23 @@ def test_different_links():
             },
         ]
 
-        for i, test in enumerate(tests, 1):
+        # Posts are network-bound, so send them all concurrently using the
+        # simple text-only posting (which should auto-detect links)
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            results = list(
+                executor.map(lambda test: service.post_text_only(test["text"]), tests)
+            )
+
+        for i, (test, success) in enumerate(zip(tests, results), 1):
             logger.info(f"\n--- Test {i}: {test['name']} ---")
             logger.info(f"Description: {test['description']}")
             logger.info(f"Text: {test['text']}")
 
-            # Use the simple text-only posting (which should auto-detect links)
-            success = service.post_text_only(test["text"])
-
             if success:
                 logger.success("✅ Posted successfully")
             else:
                 logger.error("❌ Failed to post")
 
-            # Small delay between posts
-            import time
-
-            time.sleep(2)
-
         return True
 
     except Exception as e:
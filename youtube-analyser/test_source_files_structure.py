@@ -5,6 +5,7 @@ Test script to demonstrate the new source-files directory structure.
 
 import sys
 import os
+from pathlib import Path
 from loguru import logger
 
 # Add the current directory to Python path
@@ -32,24 +33,24 @@ def test_directory_structure():
         logger.info(f"Default output path: {default_path}")
 
         # Ensure directory exists
-        os.makedirs(default_path, exist_ok=True)
-        logger.success(f"✅ Created directory: {default_path}")
+        base = Path(default_path)
+        base.mkdir(parents=True, exist_ok=True)
+        logger.success(f"✅ Created directory: {base}")
 
         # Test subdirectory creation
-        test_subdirs = ["custom", "individual", "env", "test"]
+        test_subdirs = ("custom", "individual", "env", "test")
+        subdir_paths = [base / subdir for subdir in test_subdirs]
 
-        for subdir in test_subdirs:
-            subdir_path = os.path.join(default_path, subdir)
-            os.makedirs(subdir_path, exist_ok=True)
+        for subdir_path in subdir_paths:
+            subdir_path.mkdir(exist_ok=True)
             logger.info(f"Created subdirectory: {subdir_path}")
 
         # List directory contents
         logger.info("\n📁 Directory structure created:")
-        logger.info(f"Root: {os.path.abspath('.')}")
-        logger.info(f"Source files: {os.path.abspath(default_path)}")
+        logger.info(f"Root: {Path.cwd()}")
+        logger.info(f"Source files: {base.resolve()}")
 
         for subdir in test_subdirs:
-            subdir_path = os.path.join(default_path, subdir)
             logger.info(f"  └── {subdir}/")
 
         logger.success("✅ Directory structure test passed")
@@ -112,7 +113,7 @@ def test_configuration_integration():
 
         # Test environment variable override
         os.environ["YT_OUTPUT_PATH"] = "source-files/env"
-        config = ConfigService()  # Reload to pick up environment variable
+        config.reload()  # Pick up environment variable
         env_path = config.get("download", "default_output_path")
         assert env_path == "source-files/env", (
             f"Expected 'source-files/env', got '{env_path}'"
@@ -1,51 +1,147 @@
 #!/usr/bin/env python3
 
+import functools
+import json
 import os
+import sqlite3
 import sys
-from pathlib import Path
+import time
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add the project root to Python path, unless it is already there
+project_root = os.path.dirname(__file__) or "."
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
+from services.config_service import ConfigService
+from services.minio_service import MinIOService
 from services.youtube_download_service import YouTubeDownloadService
 
+VIDEO_IDS = ("3MZS5gNElZM",)
+OUTPUT_PATH = "./downloads"
+MAX_WORKERS = 8
 
-def main():
-    video_id = "3MZS5gNElZM"
-    output_path = "./downloads"
+# Video summaries are cached on disk between runs
+VIDEO_INFO_CACHE_PATH = os.path.join(OUTPUT_PATH, "video_info_cache.sqlite3")
+VIDEO_INFO_TTL = 3600
 
+
+# Directories already created by this process
+_ensured_dirs = set()
+
+
+def ensure_dir(path):
+    """Create ``path`` if needed, skipping directories already ensured."""
+    if path in _ensured_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _video_info_cache(download_service, video_id, ttl=VIDEO_INFO_TTL):
+    """
+    Return the cached info fields for a video, fetching them on a miss.
+
+    Entries younger than ``ttl`` seconds are read from the SQLite cache;
+    lru_cache also keeps them in memory for the rest of the run.
+    """
+    with closing(sqlite3.connect(VIDEO_INFO_CACHE_PATH)) as conn, conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS video_info "
+            "(video_id TEXT PRIMARY KEY, json BLOB, ts INTEGER)"
+        )
+        row = conn.execute(
+            "SELECT json FROM video_info WHERE video_id = ? AND ts > ?",
+            (video_id, int(time.time()) - ttl),
+        ).fetchone()
+    if row:
+        return json.loads(row[0])
+
+    video_info = download_service.get_video_summary(video_id)
+
+    with closing(sqlite3.connect(VIDEO_INFO_CACHE_PATH)) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO video_info (video_id, json, ts) VALUES (?, ?, ?)",
+            (video_id, json.dumps(video_info), int(time.time())),
+        )
+    return video_info
+
+
+def fetch_one(download_service, video_id):
+    """Fetch a video's information and download it; returns (info, result)."""
+    print(f"Getting video information for {video_id}...")
+    video_info = _video_info_cache(download_service, video_id)
+
+    print(f"Downloading video ID: {video_id}")
+    download_result = download_service.download_video(
+        video_id=video_id, output_path=OUTPUT_PATH, format_selector="bv*+ba/best"
+    )
+    return video_info, download_result
+
+
+def init_minio_service():
+    """Build the MinIO service the downloader uploads to, from ConfigService."""
+    minio_config = ConfigService().get_minio_config()
+    return MinIOService(
+        endpoint=minio_config["endpoint"],
+        access_key=minio_config["access_key"],
+        secret_key=minio_config["secret_key"],
+        bucket_name=minio_config["bucket_name"],
+        secure=minio_config["secure"],
+    )
+
+
+def main(video_ids=VIDEO_IDS):
     # Create downloads directory if it doesn't exist
-    os.makedirs(output_path, exist_ok=True)
+    ensure_dir(OUTPUT_PATH)
 
-    # Initialize the download service
+    # One download service is shared by every worker; it holds no per-video
+    # state, so the workers need no locking
     download_service = YouTubeDownloadService(
-        default_output_path=output_path, default_resolution="best"
+        minio_service=init_minio_service(),
+        default_output_path=OUTPUT_PATH,
+        quiet=True,
+        noprogress=True,
     )
 
+    # Metadata fetches and downloads are network-bound, so overlap them
     try:
-        print(f"Downloading video ID: {video_id}")
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_WORKERS, len(video_ids))
+        ) as executor:
+            futures = {
+                video_id: executor.submit(fetch_one, download_service, video_id)
+                for video_id in video_ids
+            }
+    finally:
+        # Release the YoutubeDL instances the workers cached for lookups
+        download_service.close()
+
+    # Report every video, so one bad ID doesn't hide the rest of the batch
+    failed = 0
+    for video_id, future in futures.items():
+        error = future.exception()
+        if error is not None:
+            print(f"\nError ({video_id}): {error}")
+            failed += 1
+            continue
 
-        # Get video info first
-        print("Getting video information...")
-        video_info = download_service.get_video_info(video_id)
+        video_info, download_result = future.result()
+        print(f"\n{video_id}:")
         print(f"Title: {video_info.get('title', 'Unknown')}")
         print(f"Duration: {video_info.get('duration', 'Unknown')} seconds")
         print(f"Uploader: {video_info.get('uploader', 'Unknown')}")
+        if download_result.get("skipped"):
+            print(f"Already in MinIO: {download_result['minio_video_path']}")
+        else:
+            print(f"File saved to: {download_result['minio_video_path']}")
 
-        # Download the video
-        print("\nStarting download...")
-        downloaded_file = download_service.download_video(
-            video_id=video_id, output_path=output_path, resolution="best"
-        )
-
-        print("\nDownload completed successfully!")
-        print(f"File saved to: {downloaded_file}")
-
-    except Exception as e:
-        print(f"Error: {e}")
+    print(f"\n{len(video_ids) - failed}/{len(video_ids)} downloads completed")
+    if failed:
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:] or VIDEO_IDS)